@@ -0,0 +1,631 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x0b\xc6\
+\x00\
+\x00\x42\x3e\x78\x9c\xed\x99\x69\x6c\x1c\xe5\x19\xc7\x67\xbd\x3b\
+\x7b\xd8\x4e\xec\x00\x22\x05\x2a\x0a\x4d\xb9\x2a\x28\x90\x82\x44\
+\xf9\x50\x08\x4d\x8f\x84\x23\xe1\x2a\xb1\xb3\x3e\xe3\x23\xbe\xaf\
+\x38\x49\x09\x81\x82\xa8\x0a\x8d\x73\x10\x08\x90\xa4\x85\xda\xe3\
+\x38\x87\xed\xf5\xed\x38\xbe\x6f\xc7\x89\xcf\x98\x50\x10\x10\x8c\
+\x80\x52\x14\xa4\xd2\xf6\x03\xc8\xaa\xf2\xf4\xff\xce\xb1\x9e\x99\
+\xdd\x19\xef\x1a\xfb\x4b\xb5\x6f\xf4\xcb\x63\x8f\x94\x9d\xfd\xff\
+\xe7\x79\xde\xe7\x99\x37\x1c\x67\xc1\x9f\xfb\xef\xe7\xf0\xf7\x75\
+\xdc\xcd\x0f\x70\xdc\x95\x1c\xc7\xdd\x0c\x70\x89\xfb\x3d\x27\x5d\
+\x17\x17\x2e\x5c\x1e\x21\x11\x5a\xa1\x15\x5a\xa1\x15\x5a\xa1\x15\
+\x5a\xa1\x15\x5a\xa1\xc5\xd6\x91\x4d\x3c\x77\xf1\xe1\x2b\xb9\xea\
+\x44\xc7\x72\x4f\x92\x73\xad\x27\xd1\xe5\x66\x54\xc9\x54\x32\x12\
+\x54\x31\x1e\xc4\xb9\xdc\x27\xc0\x71\x70\x4c\x43\xb8\x8c\xcb\x7d\
+\xd4\x2d\x51\x81\x9f\x8f\x6c\x94\x89\x55\x13\xe1\x2e\x8f\x8d\x74\
+\x0b\xa0\x4c\x4d\x8c\xee\xf7\x20\x29\x8d\x89\x58\x03\x96\x1f\xe4\
+\x12\xb8\xb2\x14\x73\xed\x27\x13\xc2\xa0\xdb\xc5\xd5\x26\x3a\x56\
+\x40\x7b\x73\x4d\x92\xf3\x1b\x4f\xa2\x73\x86\x51\x2d\xe2\x9a\xa9\
+\x52\x48\x90\xa8\x64\xc4\x4b\x9c\x00\xc7\x15\xe2\x24\x8e\x89\x84\
+\xcf\x1c\x73\x87\xcf\x1c\x95\xa9\x50\xd8\x28\x71\x44\xa6\x3c\x36\
+\x42\x44\xd0\x51\x16\xf3\x9d\xf8\x06\x34\x95\xc5\xb8\x56\x94\x6d\
+\x88\xe0\xca\xdc\x36\x43\xfd\x75\xc9\x0e\xae\x39\x39\xcc\x52\x9b\
+\xec\x7c\x06\x5c\xaa\x4d\x72\x52\x8d\x8c\x47\x21\xd1\x49\xd5\x5e\
+\x5c\x04\x0f\xbc\x54\x32\xe2\x5d\x74\x42\xc5\x71\x46\x9c\x04\x7c\
+\x10\x81\x07\x1a\x2a\x18\x1b\xc3\xe9\x88\x8a\xf2\x58\x46\x84\x88\
+\xa0\x10\x13\x41\x65\xf3\xe3\x12\xd8\xf1\xe7\x98\x08\x0b\x72\xc1\
+\x54\x7f\x5d\x92\x9d\x47\x2c\xad\x4b\x76\x12\xa3\x56\x85\x3f\x2f\
+\x3c\x6a\x2f\x12\x75\x5e\x98\xfa\x11\xee\xd7\x8f\x0a\x43\x3f\x74\
+\x5e\xc4\x06\xe9\xc1\x86\xf0\xd2\xb2\xa7\x5c\x3c\xa2\xa1\xfe\xfa\
+\x4d\x0e\x06\x0f\x04\x40\x75\x0c\xbd\x0f\x06\x39\xe1\x31\xcb\x09\
+\xaf\x0f\x4e\xe8\x56\xd0\xe6\x84\x5f\x1f\x74\x1e\xf8\xf5\x21\x70\
+\xfd\xc2\x9c\xfa\x53\xf0\xfc\x53\xa0\x3f\xc5\x21\x34\xa4\x38\xa8\
+\x01\xfa\xeb\x55\x28\x7e\xf8\xcb\x89\x1a\xbf\x5e\x38\xbd\x39\x51\
+\x9d\x14\x41\xf5\x99\x97\x83\x2b\x44\xea\x40\x4d\xfa\x32\x3a\x91\
+\x10\xbe\xa0\x35\xf2\x5d\xf4\x37\x42\x3f\xe0\x81\xd0\xc8\xf4\x2b\
+\xf8\xf1\x20\xa8\xda\x48\x70\x52\xd7\x73\x37\xd1\x97\x43\xd9\xf4\
+\xd5\x48\xa1\xc4\x68\x21\x4d\xb7\xc4\x4b\x1e\xc4\xa9\xea\x63\xb1\
+\x6a\x23\x00\xfd\x4d\xd0\xdf\x84\xfc\x47\x14\x9a\x52\x1d\xc4\x60\
+\x3e\x18\x79\x11\x70\x8d\x24\x3a\x68\xa8\x64\x25\x7d\x31\x94\x4f\
+\xa7\x5e\x5c\x45\xd5\x85\x77\xd3\xe0\x1b\xeb\xe8\xe2\x48\x01\xd5\
+\x67\x5d\x81\xda\x70\x42\xab\x8b\x0e\xaf\x5f\x42\x07\xd6\x46\x69\
+\x78\x5d\xe6\xc0\x1a\xf9\xf7\x35\x4b\x25\x7e\xb3\x14\xd7\x96\xce\
+\xfe\x2e\x5e\x8b\xa2\x43\x0f\x2f\x81\x56\x3f\x35\x12\x88\xfe\x54\
+\x3b\xd7\x98\x6a\xe7\x11\xbd\xfa\x45\x0f\x82\xf0\xc1\x6f\x6d\x40\
+\xff\xe0\xae\x3b\x69\xba\x23\x8d\x0e\x3e\x7e\x2d\xfd\xf1\x9e\x08\
+\xaa\x2e\x58\x49\x5f\x0e\xe7\x50\x03\xea\xa0\x0a\xf9\x51\xf6\xdb\
+\x08\x2a\x79\x20\x9a\x5e\xbe\x6f\x19\xfd\x49\xc5\x2e\x1d\x25\x3f\
+\x8f\xd6\xb0\x5b\xc5\x1e\xb0\xf7\xbe\x68\x7a\xeb\xf1\x48\x2a\xf7\
+\xc9\x8b\x70\x41\x88\x75\xf1\x88\x86\xfa\x4f\xa6\xd9\x19\x3c\x10\
+\x00\x35\x33\x52\x25\x34\x7e\xf8\xf1\xc2\xb4\x46\x92\x1c\x34\xf0\
+\xf2\x6d\x74\xa1\x35\x89\x8e\xa6\xde\x42\x07\xd7\x5f\x43\xcd\xcf\
+\xde\x4b\x9f\xf5\xa5\x50\x43\xd6\x65\x62\x8d\x1c\xc5\xf7\x7d\x0d\
+\xcf\x70\xef\x2f\xa3\x69\x9f\x3f\x56\x4b\xbc\xb2\x3a\x4a\xe2\x17\
+\x12\xfb\x75\xbc\xfe\xeb\xa5\x54\xf6\x54\x84\x4f\x8d\x30\xfd\x65\
+\xb1\xe1\xa6\xfa\x5b\xd2\xed\x5c\xcb\x66\x3b\x8f\x28\x00\x3a\xc9\
+\x48\x93\x10\x7d\x48\xd3\x7a\xd1\xa8\xcf\x8d\x4d\x92\x1f\xbe\x79\
+\xe1\xa0\xee\xe7\x6f\xa0\x0f\x5b\x37\xd0\xf9\x9a\xc7\xe8\x5c\xd5\
+\x7a\xfa\x5b\xc3\x13\xf4\x7e\xe3\xa3\xd4\x90\x11\x2d\xed\x15\xc8\
+\x13\xd6\x23\x8e\xe1\xbb\x32\x8e\x6e\x8c\xd0\x50\x11\xab\x10\x2e\
+\x11\x03\x5d\x2a\xca\x91\xe3\xe5\x1b\x24\xdd\xea\xfd\x52\xb5\x5f\
+\x08\x80\x07\x86\xfa\x4f\x41\x3f\xe0\x81\x00\xa8\x45\x85\xd7\x87\
+\x34\x5f\x1f\x02\xa9\x91\xc6\xcc\x25\xd4\xf1\xec\xb5\xd4\xf9\xfc\
+\xf5\x5e\x5a\xb7\x5f\x4d\xb5\x9b\xc2\x4d\xfa\x87\x76\xa6\x98\x7b\
+\xc6\x32\xed\xa5\x02\x7c\xe3\x2b\x4c\xf4\xb7\xa6\xf3\x5c\x6b\x1a\
+\xcf\x23\x0a\xad\x9b\xed\xc4\x60\x3e\x18\x79\x11\x4c\x8d\x88\xb9\
+\x90\xc4\x8b\xd4\x7a\xb1\x07\x34\x5b\x98\xce\x9b\x09\x73\xcf\x9b\
+\x0c\xa6\xff\xc8\x1c\xfa\xdb\x32\x6c\x5c\x5b\xa6\x95\x47\x84\x7e\
+\x9e\x24\x82\xf3\xc1\x28\x27\x9a\xd2\xc3\xa9\xa3\xf8\x2a\xea\xda\
+\xfe\x7d\xea\x94\x39\x95\x8f\x59\x60\x93\xd3\xa7\x7f\xf8\xcc\x14\
+\x49\xfe\x67\x8a\x20\x7d\x10\x00\x0f\x4c\xf5\xb7\x66\x48\xfa\xdb\
+\x33\x78\x6a\x53\xf0\x7a\xc1\x1b\x7a\xd1\x62\x96\x13\x29\x76\xea\
+\x7f\xe1\x06\xfa\x7b\x4f\x2a\x48\xa7\xcf\xbb\xd3\xe8\x8b\xde\xcd\
+\x34\xdd\x14\x4b\x27\xb3\xa2\x66\xf7\x0a\xec\x13\xea\x1c\xa8\x51\
+\xd5\x83\x7a\x96\xa8\x12\x51\xe9\x8f\x57\x61\x54\x23\x71\x2e\xe1\
+\xb8\xdb\xc5\x23\x1a\xea\xef\xc8\xb4\x01\x2b\x8f\x28\xea\x57\xf0\
+\xf5\x21\xc8\x9c\x80\xfe\x91\xbd\x2b\xe9\x1f\xc3\x05\xd4\xf6\xd2\
+\x6a\xaa\xdd\x7e\x0f\x9d\x3e\xfc\x98\x38\x03\x9d\xca\xbb\x0c\xfb\
+\x84\x1d\x3d\xd2\x49\x6f\xa3\x6f\x1d\x44\xff\x3e\x24\xb2\xd4\x3f\
+\x0f\x2d\xa1\x83\x2a\x0e\xa9\x79\x70\x09\xbd\xb5\x3e\x52\x7c\xe6\
+\xfa\x9c\x40\x3e\x08\xc7\xe2\xa1\x3f\xde\x58\x7f\x27\xf4\x77\x42\
+\x3f\xa2\xd0\x99\xc9\x53\x87\x0a\x7f\x7e\x68\x72\xc2\xcc\x8f\x54\
+\x9e\xce\xee\xb9\x83\xa6\xdb\xd1\xff\x9f\x40\xff\xbf\x37\x12\x33\
+\xd0\x5d\xe8\xff\xd9\xd4\x0a\xfd\x8d\xf0\xe7\x28\xf6\xf0\x05\xe9\
+\xff\xf7\x47\x53\x39\xfa\x9f\xcf\x5e\x01\xfd\x95\x71\x2e\xbe\x72\
+\x0e\xfd\x1d\x19\x36\x49\x7f\x16\x4f\xcc\x03\x25\x1a\xfa\xb0\x59\
+\xed\xc5\xac\x07\x1a\x2f\x98\xfe\x92\x5b\xd1\xff\x13\xa9\x22\xe5\
+\x16\x7a\x73\x1d\xfa\xff\xce\x9f\xd1\xe7\xfd\x29\xd0\xbf\x0c\x35\
+\x62\x27\x0f\xbe\xe3\x1b\x0f\x2e\x45\xaf\x47\x5f\x57\xb1\x5f\xcf\
+\x6a\x2d\xaf\xaa\x78\x0d\xbc\x89\x19\xe2\x04\xf6\x7b\x8f\xbc\x5f\
+\x56\xcf\x7a\x20\x54\x21\xff\xab\x4c\xf4\x77\x67\xdb\x18\x3c\x10\
+\xba\xb2\x6c\xa4\x46\xef\x43\x20\x39\xe1\xf5\x23\x8d\xa7\xc1\x17\
+\x7f\x48\x1f\xb4\x3c\x49\x53\x55\x8f\xd0\xe4\xb1\x87\xe8\xdd\xba\
+\x47\xe9\xfd\x86\x75\xd4\x9a\xbb\xd4\xbb\x57\xd4\xb3\xbd\x4f\xa9\
+\xf7\x04\x2d\xd5\xf1\xb3\x54\x29\x20\xcf\x19\x95\x0a\x6e\x49\xaf\
+\xbf\x7d\xb3\x2a\xd1\x21\x54\x26\xda\x79\x44\x43\xfd\x3d\x39\x36\
+\xae\x27\xd7\xc6\x23\x0a\x3d\xd9\x36\x62\x74\xcb\xf8\xf3\xc2\xc8\
+\x0f\x7f\xfb\x66\x7b\x6e\x24\xf5\xbd\x70\x2d\xf5\xff\xe1\x7a\x99\
+\xeb\xa8\xfb\x99\xab\xa9\x65\xb3\x33\xe0\x5e\xda\x18\xe8\xbc\xa9\
+\xeb\xa5\x92\x1f\x0e\xc1\x93\x64\xe7\x11\x4d\xf5\x77\xe7\xc8\xfa\
+\x73\x24\xfd\x6a\x0f\x8c\x7c\x98\x2b\x27\x14\x1f\x4e\xa5\xdb\x90\
+\x0b\x36\x31\x1f\x18\x2d\x8c\x40\xfa\xc7\x82\xbc\x8b\x39\x84\x1a\
+\xe8\xaf\x31\xd1\xdf\x9b\x63\xe5\x7a\xb2\xad\x3c\xa2\xd0\x07\xfd\
+\xbd\x2a\xfc\xf9\xb1\x10\x35\x62\xba\x6f\xea\xe6\xcd\xe6\x20\xe6\
+\x4d\xd1\x0b\xd5\x6c\xc1\xf4\x7b\x12\xcd\xf5\xf7\x43\xff\x00\xf4\
+\xf7\x33\xfd\xb9\x56\x12\x09\xd2\x87\xf9\xd4\x86\x98\x1b\x62\x7e\
+\xe8\x7c\xd0\xe7\x84\x77\xc6\x52\x08\xa6\x36\x1c\x42\x5d\xb2\x78\
+\xb6\x67\xac\x3f\xd7\xca\xf5\xe5\x40\x7f\xae\x55\x18\xc8\xb3\x12\
+\xa2\x17\xaf\x1f\xb9\x36\x2f\xbd\xb9\x3a\x5f\x72\x7c\x6b\x45\xf4\
+\x23\xc3\x46\x83\x3b\xaf\xa6\x0b\x9e\x75\xf4\x09\xde\x7b\x18\xd3\
+\x0a\xf5\x6a\x9e\xa4\x8f\xe7\xe0\x82\x11\x75\x12\x1f\xe0\xdd\xaa\
+\x6b\xfb\x35\xe2\x4c\xa1\xcb\x09\x41\x3e\xdb\x33\xd4\x3f\x98\x67\
+\xe5\x86\xf2\xac\x3c\xa2\xa8\x5f\xf4\x40\xf6\x01\xbe\x50\x73\x32\
+\xe6\x94\x38\xe4\x12\xf6\x5a\x0f\xa8\x51\x70\x3b\xbd\x78\x54\x9c\
+\x44\x5f\x17\x3d\xc8\xb4\xd1\xc4\xfe\xdb\xe9\x5f\xef\xee\xa0\xff\
+\xbc\xf7\x6c\xf0\xbc\x1f\x38\xec\x1e\x67\x76\xdf\x49\x8d\xd0\xaf\
+\x7b\xff\xc0\xf3\x37\xd7\x3f\x94\x6f\x65\xf0\x40\x18\xcc\xb7\x92\
+\x48\x9e\x44\x0b\x3e\xe3\x95\x5f\x45\xd1\xee\x55\xcb\xbc\xec\x91\
+\x61\x33\x87\xc2\x3e\x2f\x51\xf4\xf6\xc3\x91\xd4\x8e\xbc\xee\xce\
+\xb2\xd2\xe4\x2b\xb7\xd3\x3f\xa7\xb6\xd1\xd7\xe7\x7f\xb7\xa8\xb0\
+\x7b\x9c\xd9\x7d\x87\x38\x73\xea\xf6\x4d\x41\x3e\xdb\x33\xd1\x6f\
+\x41\x0e\x70\xd0\x6f\x11\x86\x0a\xc2\x68\x28\x9f\x61\x15\x69\xc1\
+\xe7\xb1\x73\x88\x12\xe8\x55\xf0\xfa\x00\xbd\x0a\x6a\x2f\xde\x7a\
+\x28\x92\x3a\x50\xeb\xd8\x53\x69\x62\xdf\xad\x74\x71\x34\x8f\xbe\
+\x1a\x2f\x58\x54\xd8\x3d\x86\x4b\x6e\xc3\x3e\xc1\x6b\xdf\xc9\xd8\
+\x99\x9e\x74\xb6\x67\xa8\x7f\xb8\xc0\x02\x38\x1e\x51\x38\x0d\xfd\
+\x0a\xcc\x87\x81\x3c\xc9\x83\x3a\xcc\x22\xb5\xf1\x12\x75\xaa\x58\
+\x87\xba\xa8\x55\x51\x8f\x6b\x6d\xd8\xc3\xc4\xbd\x01\xfa\x47\x4b\
+\x6e\xa4\x4f\xfb\x93\xe9\xb3\xc1\x94\x45\x85\xdd\x63\xe8\xa5\x9b\
+\xc4\x99\x5b\xbd\x6f\xb2\x33\x3d\xf9\x6c\xcf\x50\xff\x99\x42\x0b\
+\xe0\x78\x44\xe1\x4c\x61\x18\x0d\x33\x0a\x24\xd4\x5e\x28\x39\xa1\
+\xae\x91\x01\x15\x3e\xfb\x26\xf6\x8e\xc1\xa7\x2f\xa3\xf1\x83\x77\
+\xd2\xc4\xe1\x9f\x6a\x18\x37\x60\xec\xf0\x5d\xfe\x39\x24\x31\x6a\
+\xc0\xd9\x37\x56\x52\x67\xf1\xe5\x3e\xbd\x14\x1e\x08\x4d\x69\x76\
+\x1e\x31\x60\xfd\x0a\xf3\xf1\xa1\xdf\x9f\x0f\x79\xe8\x15\x79\xbc\
+\x86\x9e\x5c\x2d\xdd\x39\x12\x5d\x39\x76\x91\x4e\x46\xf6\x2c\x1d\
+\x8c\x2c\x89\x76\x99\x36\x46\xa6\x43\xa4\x35\xc3\x61\x34\x53\xb0\
+\x33\x3d\x76\xb6\x67\xa8\xff\x6c\x11\xf4\x17\x59\x78\x44\xe1\x6c\
+\x51\x18\x89\x14\x4a\x98\x79\x71\x3a\x7f\xd6\x0f\xc3\x9c\x60\xb1\
+\xc0\x0e\x1c\x22\xfd\x22\x4e\x91\xbe\xfc\x59\x7a\x65\x7a\xf2\x66\
+\xe9\x66\xe4\x2a\xb8\xa8\x4b\xa6\x33\x47\x4b\x47\xb6\x0b\x7e\x38\
+\xfd\xce\x58\x4c\xff\xc9\x39\xf4\x8f\x42\xff\x18\xf4\x23\x0a\x23\
+\x45\x16\x62\x68\x7c\x28\xd2\x7a\x11\x50\x6e\x30\xdd\xb9\x61\x34\
+\xf2\xfc\x72\x9a\xae\x5a\x43\x9f\x78\x1e\xa1\x69\xa0\x44\xc6\xc7\
+\x81\x50\x3d\xcb\x05\x99\x8f\xfc\xf0\xe1\xf1\xb5\x34\xb0\xe3\x2a\
+\xcc\x57\x36\xed\x79\x05\x3b\xd3\x4b\xb3\xb1\xb3\x3d\x53\xfd\x23\
+\x85\x92\xfe\xd1\x2d\x16\x52\x18\x01\xa8\x09\x6a\x4f\xe7\xa9\x31\
+\x11\xfd\x54\xa6\x51\xa6\x21\x41\x4b\x7d\xbc\x74\xbd\x0b\xcf\x41\
+\xf2\x20\x8c\xce\x1f\xf8\x09\x7a\xf3\xd3\xf4\xef\xf7\x76\x2e\x2a\
+\xac\xff\x8f\xa3\xd7\xb6\x43\xbf\x76\xde\xb4\x09\x6d\xa9\x56\xbe\
+\x2d\xdd\xf8\xff\xbf\xc7\x8a\x2d\x0c\x1e\x08\x63\xd0\xac\xa6\x03\
+\x3e\x06\xdb\xff\x58\xff\xef\xc3\xde\x7f\x3a\xdf\x42\xef\x1e\xb8\
+\x0d\xbd\x79\x3b\x7a\xf4\xd3\x8b\x0a\xbb\xc7\x04\xf4\x77\x60\xe6\
+\xf4\xce\xdd\x99\xcc\x03\x9b\x20\x9f\xed\x19\xea\x9f\xd8\x6a\xe1\
+\x26\xb7\x59\x78\x44\x61\xbc\xd8\x42\x6a\x3a\xf1\x39\xfb\xd9\xfc\
+\xf3\xc0\x32\x2f\x7b\x64\xf6\xae\x8a\xf6\xb2\x4f\x45\xe9\xba\x48\
+\xc2\xbb\x04\x6a\xc3\x42\xe7\x5f\xfd\x31\x5d\x1c\xcb\xa7\xaf\x26\
+\x0a\x17\x15\x76\x8f\x71\xcc\x1a\x6c\xe6\xd4\xbe\x83\xd8\x04\xf9\
+\x6c\xcf\x44\x3f\xc7\x8d\x6f\xe5\xa0\x9f\x13\x00\x49\x58\x68\xa2\
+\x58\xaa\x83\x4e\xe4\x40\x73\xb2\x83\x9a\x93\xf4\xa0\xbf\x24\x2a\
+\x38\xbc\xf4\xe0\x3b\x88\xfb\x04\xf4\x4f\xed\xfb\x11\x7d\x3a\x80\
+\xfe\x3f\x94\xb2\xa8\xb0\x7b\x8c\xec\xba\x91\xba\x32\xad\xaa\x77\
+\x32\x71\x06\x17\x3a\x33\xc4\xb3\x3d\x43\xfd\xe7\xa0\x7f\xaa\x98\
+\xe3\x11\x85\x49\x68\x9f\xf4\x7a\x20\xfb\xa0\x43\xc9\x8d\x31\x15\
+\xea\x3d\x63\x44\xb5\x5f\x8e\x3e\x17\x4d\x53\x6f\xdf\x4d\xef\x94\
+\xdd\xe3\xc3\x54\xa9\x39\xe7\xd4\xfc\xd5\x97\x49\x15\x13\x7f\xb9\
+\x9b\x06\x30\x6b\xe8\xdf\x4d\x99\x7e\xf9\x6c\xcf\x54\xff\x39\x59\
+\xff\xb9\x6d\x1c\x29\x4c\x6e\x93\xbc\xd0\xfb\xe1\xa3\x5f\xb5\x67\
+\xce\x7a\x20\xf7\x11\x5d\xdf\x38\x63\xda\x47\x55\xbd\x34\x4f\x37\
+\x57\xf8\x7b\x27\x45\x8d\xf5\x8a\xc8\xef\xa3\xd9\xbe\xef\xe9\xf0\
+\x40\x80\x76\x1e\x31\x68\xfd\x7a\x1f\xf4\xb5\xa1\xf1\x61\x8b\x1f\
+\x1f\x8a\x54\x3e\xcc\x63\xa6\x18\x0a\x74\xce\xf4\x77\x5e\x31\xeb\
+\x81\xd0\x25\x9d\x6d\xce\x5b\xbf\x8f\x1f\x26\x39\x61\xe4\x87\x26\
+\x27\x8a\x82\x9d\x29\xe6\x98\xb1\xfc\xf8\xa1\x3a\x9f\x10\xe4\xb3\
+\xbd\x40\xf4\x97\x06\xa2\x3f\xd8\xda\x08\xc6\x87\xe1\x05\x98\xbb\
+\xfb\xb4\x3e\x94\x76\xcd\xa5\x7f\x9b\x88\x05\x3c\x03\x2e\x05\xea\
+\xc1\x5c\x39\x11\x4c\x8d\xcc\x37\x27\xe6\xa8\x91\x4b\xf0\x60\x47\
+\xcb\x66\xce\xd2\x9b\x13\x66\xa8\xff\x9d\x9d\x72\x0e\x6c\xe7\x56\
+\x40\x4b\x33\xf8\x16\xcc\xcc\x87\x49\x85\xad\x12\x13\x32\xe3\x5b\
+\x2d\x33\xf0\x41\x64\x4c\x61\x8b\x04\x7c\x98\x19\x51\x28\xb2\xcc\
+\x9c\x65\x14\x86\x21\x86\x89\xf1\x8c\xcc\xb0\x0c\x3c\xd0\x00\x0f\
+\x44\x06\x55\xc0\x83\x6f\x40\x33\xf4\xaf\x18\xc4\xb3\x6f\x2f\x30\
+\x94\x2f\xae\xf3\x39\x1c\xd7\x5b\x01\x0f\xb6\x70\xdf\x9b\xda\xca\
+\xad\x85\x16\x37\xfc\x98\x3f\xec\xdf\x6f\xe5\xdc\x93\xc5\x00\x11\
+\x1e\xb8\xc7\x8b\xfd\x33\x06\x46\xc1\x08\x63\x0b\x28\x04\x45\x16\
+\x10\x86\x9f\xad\xee\xb3\x32\xc3\x06\xc0\x03\xf7\xe9\x7c\xab\x7b\
+\x28\xcf\xea\x86\x76\x89\x3c\xeb\xda\xfe\xbc\xb0\xe5\x1f\xad\x5a\
+\xce\xf5\x14\x9b\x6b\x0f\xad\xd0\x0a\xad\xd0\x0a\xad\xd0\x0a\xad\
+\xd0\x0a\xad\xff\xff\x45\x0b\xbc\xfe\x2b\x7d\xec\x7d\xdf\x4a\xf1\
+\x07\x5f\x4b\x31\x2a\x14\xe7\x17\x15\x1f\x15\x5f\x17\xfa\x79\xfd\
+\x0f\x76\xaa\x2e\xb3\
+\x00\x00\x03\xd1\
+\x00\
+\x00\x42\x3e\x78\x9c\xed\x9a\x6d\x48\x53\x51\x18\xc7\xaf\x45\x05\
+\x0b\x32\x08\x62\x77\xe1\x35\xc4\xca\x8d\x66\x1f\xd4\x28\xdc\x07\
+\x19\x54\x46\xa1\xb3\x17\xcb\x2d\xca\xb7\x14\x8a\x3e\x44\x7d\xe8\
+\x9b\x5a\x62\x2f\x12\x15\x51\x46\xa0\x60\x41\x6f\x04\x69\xe9\xd6\
+\x5e\x34\x08\xcc\xf2\x65\x2e\x69\x69\x06\x62\xe8\xf4\x42\xb1\x92\
+\x0c\x0a\xca\xa7\xe7\xec\xce\x3b\x8d\x62\x3a\x9b\xb4\xce\xf9\x8f\
+\xdf\xce\x38\xa0\x3c\xff\xe7\x9c\xfb\xdc\xf3\xc0\xe1\xb8\x28\xfc\
+\xa4\xa5\x71\xf8\xbd\x92\x4b\xd0\x73\xdc\x72\x8e\xe3\x12\x10\x9c\
+\xe2\x4a\x39\x69\xde\x27\x9c\x58\xb6\x58\x82\x89\x89\x89\x89\x89\
+\x89\xe9\xcf\x82\xa1\x0c\x82\x02\x86\x0d\xab\x11\x6d\x38\x78\x55\
+\x9d\x9c\xda\x52\xa6\xd1\xb7\x9e\xd4\xe8\x9f\x9f\xd2\xe8\xdb\x90\
+\xf6\x72\x89\x0e\xc4\x59\x21\xd1\x85\xb8\x4e\x07\x70\x96\xab\xd3\
+\x1c\xb9\xaa\x75\x56\xa3\x52\x6b\x43\xec\x26\x3f\x46\xe5\x6a\x6b\
+\x8e\x4a\x81\xcc\xce\xfb\x70\x26\x07\x9e\x0c\x35\x8e\xb5\x18\x67\
+\x37\xd2\x1b\x0e\xda\x2a\x13\x87\xeb\xf7\xc7\x78\x1f\xe5\x0a\x5e\
+\x73\x9e\xe0\xb5\xe4\x0b\x5e\x6b\x81\x84\xbd\x50\xf0\x3a\x0e\x0a\
+\xde\xa6\x22\xc1\xdb\x8c\x3c\x29\x9e\x44\x91\xf0\xc1\x6e\x52\xf5\
+\xd9\x8c\x7c\x2f\xc1\x6e\x92\xe9\xb6\x1b\xf9\x5a\x47\x8e\x52\x8d\
+\x63\x68\xde\x47\xb2\x08\x0a\xf0\x64\xde\xc0\x18\x21\x9c\xb4\x96\
+\xaf\x85\xbb\x99\x4a\xb8\xbf\x83\x87\x07\x3b\x79\xa8\xdb\xc5\xc3\
+\xc3\xdd\x12\x0d\xd9\x3c\x34\xee\xe1\xc1\xbc\x97\x07\x0b\x62\xcd\
+\x09\x60\x23\x18\x03\xa0\x6f\x19\x07\x01\x73\xd0\xbc\x4f\xa9\x40\
+\x66\xee\xdf\x43\xd6\x3e\x73\x15\xc6\xe7\x9a\x12\xef\x88\x9f\x5f\
+\x7d\x8c\xcc\x80\xdf\xf9\x37\xa0\x7f\xf4\xfe\x00\xbd\xd7\x11\xef\
+\xd9\x12\x0d\xe8\xbd\x11\x7d\x9b\xd1\xab\x85\xf8\x36\x06\xb0\x19\
+\x83\xf8\x37\xf1\x2e\x5c\xff\xf8\x50\xf6\x80\xdf\xbf\x06\xe3\x7b\
+\x3d\x11\xe7\xb8\xc7\x00\x63\x6f\xd2\xe1\xa3\x7b\x13\x7c\xed\xdf\
+\x26\xc7\xff\x6d\x60\xbb\x6f\x6e\x3a\x8c\xf6\x6e\x81\x1f\x43\x19\
+\x73\xe5\xff\x35\xfe\xd6\x20\xb3\xf1\xef\x9e\x88\x73\xac\x2f\x1d\
+\x1e\x5e\x5a\x01\xb5\x25\xd1\xf0\xec\x76\x42\x20\xfe\x7b\x6a\xb8\
+\x51\x1a\x0d\x37\xcb\x96\x06\xe5\x4e\xc5\x32\x78\xd7\x92\x0a\x20\
+\x66\xcd\x85\x7f\xf7\x5f\xf3\x8f\xfb\xf6\x13\xae\x5f\x6d\xc9\x12\
+\x38\x7f\x28\x0a\x2c\x55\xb1\x72\xfc\x96\x6b\xb1\x70\xe1\xf0\x3c\
+\xb8\x78\x64\x7e\x50\x2e\x1f\x5d\x00\x3d\xb6\xe4\xc8\xf3\x8f\x90\
+\x3d\xdf\x82\xeb\x6e\xae\x8a\x01\xb7\x35\x49\x8e\xbf\xd7\x91\x82\
+\x39\x10\x82\x53\x25\x40\x53\x4d\x1c\xbc\x77\xe9\x31\x9f\x91\xe7\
+\x3f\xac\xf5\x9f\xf9\xff\xe7\xfd\x53\xbd\xff\x59\xfd\xf3\xbf\xff\
+\x54\xbe\xf7\x5f\x0b\x6d\xef\x3f\xff\xf9\xe7\x73\x64\x9d\x7f\xfe\
+\x7e\xfd\x23\xeb\x46\x98\xf4\xfc\xfa\x7e\x8b\x33\x20\x42\xeb\xdf\
+\xf7\xc1\x0c\xe8\x7f\xba\x11\xdc\x8f\x93\x40\x74\xa6\xc9\xf1\x93\
+\x7a\x46\xe6\xa6\x43\x5f\xf3\x7a\xf8\xf2\x76\xeb\x94\x3e\x20\x22\
+\xfc\x63\xbc\xa3\x3d\x9b\xe1\x16\x3e\xbf\xa4\x86\x39\xaa\xe3\xe4\
+\xf8\x49\x4d\xbf\x72\x6c\x21\x5c\x3d\xbe\x28\x28\xd7\x4f\x28\x7c\
+\x39\x88\xb8\xe7\x9f\x76\xff\xb4\xef\x7f\x56\xff\x22\xb1\xff\x0f\
+\xc3\xf9\x87\xf5\xff\xb4\x9e\x7f\xa9\xee\x7f\x58\xff\x4b\xbd\x7f\
+\xaa\xf7\x3f\xab\x7f\xac\xff\x67\xfd\x3f\xd5\xe7\x5f\xaa\xfb\x1f\
+\xda\xfb\x5f\xda\xfd\xd3\xbe\xff\x59\xfd\x63\xfd\x3f\xeb\xff\xa9\
+\x3e\xff\x52\xdd\xff\xb0\xfe\x97\x7a\xff\x54\xef\x7f\x56\xff\x68\
+\xed\xff\xa7\xdc\x7f\x8c\xb0\xfe\x7f\xb6\xf7\x1f\xe9\xbd\xff\x3a\
+\x64\x20\x90\x7b\xef\xff\xe6\xfd\xe7\xe9\xf9\x0f\xf9\xfe\xb3\x2f\
+\x07\xc3\x98\x03\x4f\x16\x79\x06\x6e\xfa\xf7\x41\x77\x38\x68\xab\
+\x4c\x1c\xa8\x3f\x10\x23\x36\xe4\x09\xa2\x19\xb1\xe4\x0b\xa2\xb5\
+\x40\xc2\x5e\x28\x88\x8e\x83\x82\xd8\x54\x24\x88\xcd\xc8\x93\x62\
+\x1c\x0b\x63\x06\x6d\xfb\x54\x6e\xf4\xdc\x3d\x19\xbb\x49\xa6\x8b\
+\x78\x6f\x32\xaa\xd4\x8e\x10\xef\xbf\xcb\x39\xf0\x90\x1c\x18\xc8\
+\x3d\xf8\x78\x64\x4d\x38\x70\xd7\xa4\xa4\xb4\x56\x68\x75\x2f\xce\
+\x68\x75\xed\x48\xc7\x59\xad\xae\x13\xc7\x4e\x1c\x9d\x95\x5a\x5d\
+\xd7\x39\xad\xce\x55\x29\xf1\x12\x71\x96\x6b\x36\x60\x0e\x34\xe8\
+\x79\xcd\x1f\x88\xb7\x99\x54\x0a\x64\x56\xde\x99\x98\x98\x98\x98\
+\x98\xfe\x57\x41\xa8\x2a\x25\x7f\x1d\x05\xe0\xff\x37\xe3\xd2\x58\
+\xc2\xc6\xb9\x19\x27\xf2\x2e\xaf\x43\x88\xfa\x09\xe8\xe4\x98\xe9\
+\
+\x00\x00\x0d\x10\
+\x00\
+\x00\x42\x3e\x78\x9c\xed\x5b\x0d\x70\x5c\x55\x15\xbe\x9b\xa4\xff\
+\xb4\xa9\x4d\x76\xf7\xbe\xdd\xfc\xb5\xe5\xa7\x16\x8b\x14\x46\x5a\
+\xa0\x4c\x8a\x38\x82\x50\x86\xbf\x41\x14\xa4\xe2\x00\x02\x82\x20\
+\xa8\x53\x67\x04\x12\x87\xd2\x6a\x2d\x15\x68\x49\x76\xdf\xdb\x4d\
+\x22\x88\x03\x03\x33\x45\x45\x41\x44\x68\x11\x01\x6b\x15\xb1\xd6\
+\x42\xd3\x24\xef\xdd\xdd\xed\x0f\xe5\x27\xa5\x28\x41\xd3\xac\xdf\
+\xb9\xf7\x6e\x1b\xb6\xfb\x36\x6f\xd3\xcd\xa6\x83\x3d\x9d\xd3\x93\
+\x7d\xbb\x7b\xef\x39\xe7\x9e\x7b\xee\x39\xe7\x9e\x65\xcc\x87\x7f\
+\x0b\x17\x32\xfc\xdf\xc0\x66\x7d\x96\xb1\x00\x63\x6c\x16\x10\x8f\
+\x58\x33\x53\xcf\x25\xe0\x41\xd5\x24\x85\xff\x0f\x60\x9b\x9c\x75\
+\x47\x02\x3e\xc7\x32\x2e\x70\x4c\xde\x29\x4c\xfe\x8a\x63\x1a\xf3\
+\x9c\x68\x68\xb4\x59\x1b\x71\x48\x5a\x41\xb6\xd3\xf2\xfb\x20\xf7\
+\xd9\x90\xff\x75\x61\x19\x69\x42\xc8\xff\x82\x63\xf1\xb9\x40\x46\
+\xf8\x71\x84\x04\xe4\xda\x6d\x4d\x65\x90\xf7\x6c\x31\x48\xf6\x41\
+\x3a\x78\x51\xea\xc0\x34\x46\x9b\xd5\xa2\x83\x13\x0d\x33\x3b\x52\
+\x57\x06\x5b\xff\x9c\xb0\xf8\x3f\xb3\x65\x1f\xa4\x83\xf5\xd0\xc1\
+\x29\xa3\xcd\x6f\x31\xc1\x36\x83\xec\x6d\xb3\x96\x39\x52\x76\x63\
+\x8b\x9b\xec\x83\xf0\xe5\x52\xf0\xd5\x1b\xaf\x64\x9d\xad\x35\x58\
+\x1b\xde\x80\x75\xb9\x32\x61\xf2\x13\xba\xe2\x61\xf2\x4b\x0c\xaf\
+\x99\x88\x06\x2b\xc0\xcb\x19\x58\xaf\xaf\xe0\xbd\x20\xb0\xe0\x39\
+\xf0\x5d\xc2\x32\xe0\x59\xc0\x7f\x78\x90\x1d\x36\xc0\xb7\x16\x5b\
+\x56\x01\xbf\x03\x2c\xc3\x5a\x54\x6c\x69\xf1\xb3\xce\x48\x80\xf6\
+\x21\xe1\x58\xe0\x2a\x3d\xf7\x6f\x60\x7f\xd3\x68\xff\x11\x8a\x28\
+\xaf\xc3\x33\xb2\xd5\x7d\xc0\x5b\x53\x0f\xd4\x32\xbb\x3d\xc0\x6c\
+\x8c\x05\xf4\x01\xc7\xdb\x34\x26\x5e\xe7\x02\xa7\xdd\x60\xa9\x35\
+\x7e\xd2\xe5\x99\xf8\xfe\x66\x6f\xb2\x1b\x5b\xa1\xff\x8b\x8b\x2a\
+\x7b\x24\x44\x38\x01\xfb\xea\x46\x8c\xfd\x43\xe8\x77\x86\x5a\x63\
+\x92\xd1\x98\x80\x79\xdb\xe4\xfc\xa6\x91\xc2\xeb\x99\xf2\xb9\xb2\
+\x81\xd3\x41\xdf\xd7\xbc\x35\x3b\x2d\x06\x4b\x74\xa8\xf7\xc0\x27\
+\xd9\xf2\xcf\x41\x17\xf7\x44\x8c\xb2\x6c\x9f\xa5\x75\x08\x3f\x6f\
+\x2c\xc4\xbc\x7f\xf7\x22\x3b\xb0\x0b\x9f\x5d\xd4\xd5\xe1\x2f\x2b\
+\xaa\xfc\x66\x88\x70\x0e\xc6\x77\xa4\x8e\x2d\xbe\x62\xf7\xca\x89\
+\xe0\xd9\xcf\xd2\xcb\x8e\x23\x79\xee\xd6\xf3\xef\x05\xce\xd3\x76\
+\x41\xfa\xf9\x12\x68\x1f\xb0\x1f\x3a\xbb\x01\xc8\x48\x6f\xc0\x6a\
+\x3c\x7b\x5a\xaf\xd7\x9f\x9c\xd6\xd0\x24\xe7\x81\x03\x67\xb7\xd3\
+\x8a\xcf\x3c\x29\xe5\xc7\xde\x31\x5e\xf3\xb8\xee\x5d\xc0\x0b\x9d\
+\x18\x74\x69\x15\xd7\xff\x27\xac\x10\xa1\x81\x79\x36\xea\xf9\x36\
+\x61\xae\x59\x72\x8d\xd4\x79\x7b\x93\xb6\xf1\x3e\xac\xf9\xa5\x52\
+\xf6\x98\x94\xff\xbb\xfa\x79\x2f\x64\xbf\xc8\x91\x3e\x41\xca\x75\
+\x2e\x9e\xbd\xab\xf9\x6e\xb7\x23\xc6\x18\x27\xa2\x78\xb6\x89\xf7\
+\xb4\x92\x1d\x72\xfc\xcd\xe3\xba\xf7\xc8\xf1\x3b\xaa\x7c\x4e\x2c\
+\xf7\x5e\x3a\x14\xd0\xeb\xe9\x03\xde\xa1\xe7\xeb\x07\xde\x28\x1e\
+\x9a\x9d\x91\xff\x12\xbc\xde\xa3\xd6\xd9\xf8\x66\x82\x64\xb7\xc2\
+\xe4\xb7\xee\xd1\x9f\x4f\x42\x17\xa7\xaa\xfd\x12\x24\x7f\x11\xd5\
+\xcf\xdf\x87\xbe\xce\x77\xa2\x41\xa9\xe3\x1d\x6d\x61\x96\x7e\xe2\
+\x68\xf8\x7b\x63\x01\xc6\x79\xb5\x80\x75\xbf\x28\x11\x09\x96\xc3\
+\xdf\x14\x5d\x76\x82\x37\x1e\x3e\x86\x25\x30\x36\xf6\xc0\x5c\xcc\
+\x69\xab\x3d\x60\x3c\xdf\x13\x0f\x55\xd2\x3a\x27\x62\xfc\x68\x3c\
+\x7b\x11\x98\x70\xac\x10\xc5\x26\x78\x16\xa2\xf3\x6a\x31\xfe\xde\
+\x05\x5c\x0b\xbb\xac\x92\xb6\x6f\x86\x66\xd1\x7a\x69\xfe\x9f\xc3\
+\x67\x82\x64\x17\x49\x8c\xb3\xf5\x7e\x7c\xcf\x82\xec\x1e\x6d\x9e\
+\x78\x81\xec\x17\xef\x8e\xf9\x7d\x89\x68\xf1\xd7\x7d\x30\x50\x6c\
+\xed\x44\x42\xe3\x9d\x03\x6b\xf7\x86\x13\xe7\x86\x88\x71\xf6\x8e\
+\x39\xd9\x87\x75\x9c\x8e\x67\xb3\x9d\x58\x68\x2c\x9d\x59\x24\x93\
+\x0d\xdf\x08\xfa\x29\xf0\x18\x76\x5a\x6a\x61\x0f\x21\xc2\x53\xf1\
+\xb9\x9d\xc0\xff\x00\x6f\xde\x09\x1f\x0f\xff\xc7\x36\xad\xac\xa3\
+\xef\xc0\x77\xf0\x8d\x5e\x64\xc7\x98\x36\xf6\xca\x25\x09\xd3\x28\
+\x17\x87\x10\xef\x89\x48\x15\x13\x6b\x88\x06\x30\x0e\x1f\x07\x1e\
+\x26\x01\xc7\x25\xe8\x7c\xcb\xd2\xa9\xf4\x5f\x26\x3f\x1e\xf3\xff\
+\x10\x78\xa5\x6d\xf1\x31\x85\xf8\x1a\x81\x38\x26\x61\x06\x26\x62\
+\x8c\x6b\x20\xe7\xb7\x9c\x18\xaf\x26\x5d\x25\x5b\xe5\x19\x3f\x7f\
+\x90\x7f\x19\x0a\xc9\x0f\x7f\x31\xd7\xb9\xe1\x06\x03\x4b\x27\xb1\
+\x74\x98\x78\xe0\x13\x60\x8b\x21\xec\x59\x92\x03\xb6\x16\xba\x00\
+\xf4\x1b\x98\xff\x47\x40\x3a\x8f\x5e\xc0\xeb\xb6\x04\xad\x6d\x96\
+\x6c\x3b\xe2\x61\xb6\xbb\xbd\x96\xe2\xf0\x8a\xee\xa8\xbf\x0c\xe8\
+\x59\xf6\x0c\x6c\x7f\xb0\x81\xd0\xa7\x91\x89\x36\xc4\x4f\xf1\xd0\
+\x64\xf0\xf3\x94\x67\xd9\x63\xfc\x52\xc7\x0c\x96\x3b\x1e\xe3\xa9\
+\x24\x7c\x6e\x8f\x3a\x8f\x3e\x83\xef\x3f\x0e\xfc\x83\x50\x71\xe4\
+\x5b\xda\x97\x65\xcf\x81\x73\x8c\x5f\x9c\x2d\xff\x48\x40\x8a\x7c\
+\x85\x69\x7c\x02\x7a\x7f\xd9\x83\xec\x49\x5a\x77\x60\x79\x21\xbc\
+\x75\xb7\x06\x91\x37\x72\x8a\x53\x4f\xd2\x36\x36\x30\xc4\x3c\xff\
+\x85\xfc\xdf\x2e\x85\xfc\xe4\x13\x36\xde\x5d\x41\xe7\xdd\x65\xe4\
+\x3f\x87\xe0\xeb\x19\xac\x61\xd5\x70\xf6\xfb\xae\x76\xce\xce\x38\
+\xc6\x0f\x5d\x07\xc9\xff\xfe\x0c\xf8\x41\xde\xb9\x4c\x7e\x2f\x9d\
+\x6d\x6f\x46\x6a\x46\x40\xea\x8f\x02\xc9\x03\x1b\xa8\x80\x2f\xb9\
+\x10\xf3\x6e\xcb\xc3\xd7\x5e\xd8\xfc\xd5\x1b\xcc\xa3\x58\x8f\x59\
+\xb8\xbf\xa7\xd8\xc2\x86\x4f\xb3\x4d\x3e\x15\x63\xfd\x58\xad\xb3\
+\xab\x7f\x7d\x14\xfe\x6a\x8c\x18\x46\xce\x32\x1c\x48\x82\xb7\x5f\
+\xac\x90\x7b\xf4\x0b\x98\xbf\x2b\x8f\x0e\x5e\x83\x9e\x8e\x1b\xae\
+\x6d\xca\x58\x36\x1a\x46\x3e\x25\x63\xd6\x7d\x79\xe6\xf9\xbd\x13\
+\x35\xfc\xc0\x22\x4b\x9a\x87\xb7\x28\xce\xc8\x96\x99\x94\x3f\x52\
+\x3c\xb5\xcb\x85\xaf\x7d\x78\x7f\x19\xe5\x62\xa2\xc0\x3a\x8f\x58\
+\x3d\x2d\x93\x4f\x52\x2c\x7f\x50\xfd\xe4\x20\x3d\x9b\xc6\xb1\xa5\
+\xae\xa5\x38\xb1\x30\xb3\xe3\x75\xc8\x9b\x43\xb7\x0b\x95\x3b\xe4\
+\xe2\xed\x0d\xe8\x60\x4e\xa1\x71\x3e\xc5\xde\x62\xb5\x51\x06\x1b\
+\xbb\xdd\x83\x0f\x4c\x61\xfc\x79\xc5\xce\x25\xbc\xf1\x49\x79\x02\
+\xe7\x98\xfb\xb7\x2e\xbc\x11\xef\xdf\xef\x6e\xf5\x7e\xfe\x13\xd8\
+\xc8\x0d\x7a\x62\xc1\x00\xfc\xda\x9f\x73\xfb\x3c\xf8\x44\xd3\xd8\
+\xa1\xc7\xff\x10\x7b\xff\x1c\x1a\x7f\x4f\xfb\xe4\x11\x94\x36\x37\
+\x08\x15\x6b\x5d\x00\xfa\x5e\x4e\xff\x64\xf1\x0d\x88\x63\x02\x85\
+\xac\x8f\xce\x55\x2e\x12\x2a\x57\xc9\xa5\xd7\xc7\x30\xe7\x59\xa0\
+\xbf\x14\x2a\x2e\xf8\xaa\x4d\xf1\x99\x55\xfa\xba\xb2\x50\x39\x57\
+\x25\x70\xad\x0b\xaf\x24\xc3\x85\x5e\xfd\x60\x62\x4d\x88\x3d\x9b\
+\x96\x3a\xf8\x49\x9e\xb3\xe5\x72\x8a\xe7\xf1\x99\x1a\xf8\x88\x5b\
+\x90\xdb\x9c\x6c\x23\x36\x4d\x76\x94\x5e\x7e\x5b\xc6\xca\xb2\x86\
+\x72\x25\x78\xfb\x97\xcb\x19\xb5\x72\xf7\x1d\x3e\x66\xb7\x0d\x7d\
+\x46\xcb\x7a\x1c\x72\x2d\x7c\xef\x39\x17\xf9\x5f\xc5\x5a\x87\x69\
+\xbd\x53\x56\x80\xd0\xa7\xb1\x04\xd2\xba\xf1\x2c\xcf\xc3\x7a\xe1\
+\x9e\x0f\x3e\x8b\xb5\x0a\x78\xa9\xf7\x6b\xbf\x4f\xf1\x5f\xce\x18\
+\x0b\xba\x8c\x76\x5b\x75\x65\x9d\x8f\x9c\x50\x02\xc9\xbc\x81\xb8\
+\x6d\x26\x13\xf7\x71\xaa\x79\xb7\xbb\xc8\xef\xe0\xbd\x13\x87\x8a\
+\x51\x6c\xac\x61\x42\xe6\x9e\xc6\x79\x42\xe5\x9d\xd9\xe3\xd0\x5e\
+\xbf\x2a\x89\xfc\xe6\x70\x03\x11\xa7\xbc\x99\x5f\x2b\x72\xe7\x29\
+\x1f\x02\x29\x5e\x92\x39\x8e\x1b\x90\x7d\xec\xb4\xea\x49\xfe\x9b\
+\x5c\xf4\xf8\x1e\xf2\xa9\x79\x89\xc3\xf0\xde\xc4\x56\x35\xd6\x05\
+\xe0\xf1\xdf\x2e\xbc\x5f\x9f\xa2\x1c\x32\x8f\x0d\x90\xfc\xdd\x96\
+\x9f\x62\xbe\xa5\x2e\x63\x6c\xc3\xf7\x8f\xf5\x9a\x4f\x96\x12\xf4\
+\xbe\xa5\x9c\xc5\x76\xe1\xbd\x49\x58\xd5\xbe\x7c\xb1\xa0\x1a\x83\
+\xee\x22\x78\x8b\xcb\x18\x1b\xa0\xa3\xda\xc3\xf1\xde\x50\xfb\xed\
+\x06\xf2\xcf\xb9\xe3\x00\xe3\x7e\xe4\xf6\xe5\xf9\xe2\x00\x7d\x96\
+\x8e\x11\x99\x3a\xfd\xc1\xb8\x1e\xba\x31\x0a\x8d\xa7\x4b\x01\xfa\
+\x1e\x20\x0c\x1e\xff\x98\x93\x77\xd3\x88\x60\x7f\x54\xe4\xcb\x89\
+\xf5\x3d\x05\x7d\x26\xee\x22\xff\x3a\xcc\xc1\x0f\xc7\x7b\x53\x6d\
+\xff\x24\xff\x4b\x2e\xf2\x47\x87\x92\x9f\x6c\x03\xb9\x2f\xe5\xd7\
+\xad\x2e\xf2\x53\x3c\x4c\x77\x55\x25\x94\xcc\x1b\xe8\x9a\x63\xbd\
+\x9b\xfd\x63\x6f\xdc\xa7\x6b\x97\xae\x63\xc8\x3d\xd4\x9a\xd7\xff\
+\x75\x41\x7f\xc7\x1e\x4a\x1d\x75\xa4\x40\xdb\xff\x27\x85\xbe\x7b\
+\xca\xe5\xff\xba\x5a\xaa\x7d\xf9\x7c\x37\x9d\x6b\xdb\x7e\x6a\xe4\
+\x3b\xff\xde\x17\xb1\xd0\xfc\x52\xd5\x3a\x0a\x01\x47\xdd\x17\xd1\
+\xf9\x97\x3b\x06\xb6\x8c\xeb\x76\xe2\xfc\xb3\xf3\xc9\x8f\xb8\x46\
+\xda\x80\x65\x2c\x12\xb9\x6b\x3e\x32\xfe\x11\xf1\xc3\x6f\xfd\x93\
+\xf2\x1e\xc9\xc8\x17\xff\x9c\x4d\xb1\x5d\xd7\x10\x71\xfa\xd0\xf1\
+\x2f\x37\x7b\x22\x81\xa2\xde\x9b\x1e\x2a\x6c\x7e\x74\x32\xdb\xd6\
+\x51\x85\xb3\xcd\x35\xfe\xb5\xb1\xae\x9f\xf6\x62\xb7\x3a\x97\xe0\
+\xf8\xce\xf3\x2e\x63\xfd\x15\xb6\x54\x33\x1a\xf5\x8e\xfd\x3c\x1e\
+\xb8\x67\x24\x64\xc8\xef\x09\xc9\xf7\xb9\xdd\x7f\x3f\x03\xd9\xfd\
+\x5e\xe4\xa7\x3b\xc9\xb7\x1e\x6e\x20\x1b\x70\xcd\x7f\xf1\xde\x97\
+\x45\x3c\xc0\x44\x4b\x6d\x09\xa4\xfd\x28\xa4\xa2\x7e\xd6\x13\x97\
+\x77\x2b\xa7\x80\x97\xdb\x20\x53\x8d\xea\xb9\x30\x16\xbb\xee\x7d\
+\xd3\x58\xf1\x5e\xdb\x49\xac\x33\x3a\xd5\xd3\x1c\xda\x06\xa8\xb6\
+\x98\xb3\xa6\x22\xe4\xdd\x08\x9f\x32\x1a\x71\x50\x22\x82\x73\xae\
+\x9d\xfa\x0c\x8c\xab\xf5\x5e\x7f\x12\x76\xff\x79\xe1\x5e\xff\xe8\
+\x85\x8e\x16\x15\xe2\xb3\xf7\xef\x01\x93\xff\x25\xb7\x2f\xe5\x7b\
+\xe0\x47\x17\x8d\x46\x1c\xbc\xa5\x75\x8a\xac\x4d\x63\x4d\x33\x39\
+\xea\x00\xf8\xa0\x1a\xb0\x5b\x0d\xf4\xa5\x84\xea\xa3\xf0\x3c\x07\
+\x9d\xa5\x74\x67\x28\x64\xce\x90\x73\x4c\x3a\x4f\x9e\xce\xdc\x49\
+\x97\x1a\xf4\xfe\xcf\xdc\x0f\xe7\xe4\x4f\x23\xd5\x27\x97\x88\x07\
+\xe0\x27\x0a\x88\x59\xde\xfe\x9d\x5f\xc5\x53\x16\xa7\x7b\x7c\xb7\
+\x7b\x96\x0f\x60\x1f\x4b\x52\x2d\xd5\xe5\x23\x7d\xa7\x9e\x0d\xba\
+\x3e\x49\xb9\xde\x50\x7d\x5e\x9b\xc1\xe3\xec\xe1\xc4\x2b\x89\x0e\
+\xce\x92\x0f\x05\xcb\xd5\x7d\x6f\xee\x1a\x38\x6c\x20\x85\xf7\x17\
+\x6d\x7f\x64\x1c\x23\x7f\x58\x2a\xd0\xf2\x53\x8d\x6e\x5d\x1e\xd9\
+\xf7\x61\xcd\x7f\xb0\x2d\x52\xe3\xb3\xcd\xe1\xd5\x25\x85\xba\x0b\
+\x9e\x0d\xba\x29\xcf\x3c\x9b\x60\x2b\xa7\x6d\x8f\x85\xe4\x9d\x59\
+\x29\xa0\x27\x16\x64\xdd\xb1\x00\xf5\xc7\x3c\x96\x87\x2f\xba\x9b\
+\x5d\x05\xac\xa6\x78\x2d\xbb\x47\xc1\x0b\x50\x2f\x47\xe7\xea\x06\
+\xda\x3b\xd7\x89\x03\xfd\x69\xb9\xfc\x21\xe5\x45\xa7\xa7\x3a\xea\
+\x7c\x89\x12\xd4\xc6\x36\x3f\x7e\x14\xce\x01\xd9\x37\xb3\x7a\x08\
+\xfb\xef\xc3\x67\x1e\x93\xbd\x18\xbf\xba\x82\x39\xf1\x86\x82\xe7\
+\x92\xfd\x59\x31\x83\xee\x41\x1f\x1c\x62\x2e\xda\x8b\x0b\x9c\x18\
+\x47\x1e\x31\xf2\x75\x70\x21\xfb\xe3\xf8\x12\x91\x3b\xde\x3d\x28\
+\x66\x53\xf5\xcf\x20\xbe\x53\xf8\xfa\x68\x7f\x4b\x77\xa9\xaf\xe4\
+\x99\x83\x62\x0f\xc4\x45\x2a\x87\x18\x69\x50\xf2\xcb\x1e\x87\x5c\
+\x76\x49\xe7\xe2\x2e\xbd\x26\xe4\x23\x1e\xc5\x79\x3d\x97\xf8\xea\
+\x76\xe9\x21\xcd\x07\xdd\xd8\xdb\x4b\x9e\x5b\x40\xf3\x9d\xe9\xe4\
+\xee\x2b\xde\x07\x1b\x8b\xf7\x58\xc1\xa9\x38\x6b\xd9\xda\x08\x63\
+\xaf\x23\xd7\x02\xfa\x34\x16\x3c\xa7\xad\x6a\x11\x65\xdd\x96\x51\
+\xd1\x89\xbf\xbb\xb2\xce\x6f\xbd\x26\x21\x20\xd5\x6a\x9e\xd7\xf6\
+\x89\xbc\x9d\x7f\x1d\x78\x1e\xf8\x39\x15\x48\xbd\x87\x38\xa3\x83\
+\xe3\x0e\xf5\x9c\x76\xac\x63\xd8\x96\x87\x65\x8d\x84\x72\xc3\x9e\
+\xac\x73\x80\xea\x62\x33\x32\xf1\xa0\xae\xc5\x21\xde\x36\x6e\xc5\
+\x7b\xd7\x26\xad\xe0\xc4\x44\x01\xb1\x12\x7d\x36\x69\x72\xaa\xc3\
+\x51\x4c\xbb\x02\x63\x1c\x9f\x9d\x6f\x90\x3f\x13\xad\xb2\xe7\x77\
+\x1c\x3e\x33\x51\x52\x93\x97\x09\xad\x9b\x91\x00\xad\xf3\x0a\xe8\
+\xf4\x7c\xa1\xfa\x95\x49\x7e\xea\xad\x3b\xab\x2b\x12\x96\x7c\x77\
+\x03\xb7\x47\x65\x7c\x76\x8b\xb6\xc3\x9d\xb4\x16\x32\xaf\x6c\xd3\
+\x35\x2a\xd5\xeb\x36\x21\xa1\xfa\x7b\x81\x61\xea\x85\x3b\x3e\x61\
+\xf2\x19\x6f\x9b\x53\x7c\xea\xdc\x09\xd1\xda\x6e\xd5\xfa\x35\xf1\
+\x7a\xbc\x28\x81\x5f\x19\x0a\x6c\xec\x85\xf4\x8d\xd2\x0e\xa8\xe7\
+\x76\x2d\xd6\xf8\x9a\x9e\xc8\xb4\x72\x5b\xf7\x78\xe9\x3a\xd4\xe0\
+\xfb\x33\x9b\x7a\x19\x75\x3f\x6f\x15\x5e\x3f\x01\x7c\x13\xbe\x6b\
+\xb1\xbe\x6b\xa1\xe7\xe7\x08\x95\x6f\xbf\x28\x7b\x24\x63\xd4\x87\
+\x15\xae\x84\x6e\x32\x63\x38\xf8\xfb\x64\x3a\xf7\xb7\xad\x99\x3e\
+\xca\x1a\xa0\x5a\x43\x1d\x4b\x59\xf5\xd4\x73\x3d\xd5\x89\xf2\xb1\
+\x99\x7a\xa8\xec\xff\x8e\x07\xc9\x26\xc9\x3e\xf6\x6a\xde\xa3\x88\
+\x0b\xc6\x6a\xf9\x29\x66\x4d\xaa\xe7\x7c\x25\xf5\xbe\xea\xfe\xcf\
+\x9b\xb5\x1f\xdf\x43\x3d\xb2\x24\xe7\x8e\x35\xd2\x36\x6e\x10\x07\
+\xea\x30\xd4\x53\xeb\x1b\x29\xdb\x2e\x06\x08\xe5\xb3\xa8\xd7\xb1\
+\x43\xf3\xfc\x2e\xfe\x3e\x57\xc4\x42\x99\xba\x0a\xf5\xca\xf5\x2a\
+\x7f\x69\x7c\x47\xf5\xff\x52\x4f\x93\xec\x85\xee\x93\xcf\x2d\x7e\
+\x13\xc9\xaf\x73\x30\x3a\x73\x32\xb1\xd7\x46\xe8\xca\x28\x45\x7c\
+\x31\x5c\x20\x9e\x9d\xa8\x31\x09\xb2\x6d\xd0\x3c\x3f\xe5\x58\xc1\
+\x2a\x60\xa6\x9f\xfd\x06\xbd\xce\x24\xeb\x65\x22\xd3\xff\x6e\x85\
+\xe6\x0d\xb2\x97\xbb\x77\xdc\x37\x93\xa5\x4c\x3f\xdb\xbb\x8a\x7a\
+\xe7\xf9\x8a\xcc\x1e\x00\xce\x39\x9c\xd7\x3f\x93\x37\xd2\x6f\x15\
+\x04\xf5\xce\xa9\xdf\x2e\xb0\x64\x94\x33\x3b\x2e\xf7\x7a\xb3\x96\
+\x05\x67\x36\x3f\x4d\xe8\xdf\x46\x38\x56\x68\xa6\x90\xb9\x84\x7c\
+\xaf\x0d\xfb\x65\x82\xec\x81\x57\xbf\x0d\x99\x01\xba\x1c\xba\xbb\
+\xde\x31\x03\x13\x9c\xe8\xe8\xdd\xb3\x7b\x01\xd9\x3b\x14\x95\xbd\
+\x43\xe3\x33\xfb\xd5\x81\x6f\x4c\xb6\x51\x4d\xc9\xb8\x55\xa8\x5e\
+\xb2\xcd\x90\xaf\x56\xfd\x2e\x40\xe2\x34\x3c\xfb\xb5\x96\xff\x1e\
+\xbb\xd5\x3f\x96\x7a\xdd\x53\x6b\x02\x6c\xf7\xaa\x69\xcc\x89\xf0\
+\x0a\x1b\x63\xda\x25\xec\x31\x2b\x36\xd0\x6f\x9a\xe8\xb7\x4d\x90\
+\xf5\x72\x47\xf5\xae\x97\x6b\xd9\x59\x4f\x9b\xcc\xcf\xe7\x00\xaf\
+\x40\xce\x51\xdf\x19\xaf\x65\xef\xdc\x5b\x3d\xda\x2c\x1f\x81\x23\
+\x70\x04\x8e\xc0\xc7\x1a\xd2\x0a\xc6\x29\x32\x50\xae\xa9\x4f\xd1\
+\x3e\x36\x88\x3a\xcb\xd3\x36\xe8\x87\xeb\x97\xd7\x13\xed\x5d\xbf\
+\xbc\xb2\x99\xe8\xd7\x96\x55\x36\xfb\x14\x65\xe5\x44\x97\xd6\x31\
+\x8c\xd7\x37\x7d\x69\x0d\xab\x24\xba\x72\x3e\xab\x4f\xf7\xf6\x37\
+\xf6\x9f\xc8\x1a\xfb\xd9\x9d\x4d\x03\x57\xb1\xa6\x3e\xd6\x94\xa6\
+\xe1\x24\xed\xf5\xa5\xfb\x35\x1d\x60\x8d\x69\xbc\xc8\xd0\x26\x49\
+\x07\x58\x53\x3f\xd1\x34\x7d\x9f\x68\xf3\x01\x5a\x46\x74\x5d\x63\
+\x5f\xb9\xa4\xf5\x7d\x52\x02\x50\x29\x91\xbd\x9f\xf6\x2a\x5a\xe9\
+\x95\x66\x7f\x7f\xff\xb8\x44\xfb\xd7\xd5\xf7\x4b\xba\xb0\xb1\x9f\
+\x34\x05\x66\xf6\x53\xa6\xe8\x00\xc9\x23\xf9\x57\x34\xad\xe5\x49\
+\x93\x4a\x48\xa8\x66\x49\xeb\xd3\xeb\x34\xb5\xa7\x34\x0d\xdc\x89\
+\xe7\xbd\x35\x8d\xfd\x8d\x78\xd6\xbb\x60\xee\xd2\x7a\x1a\x6b\xfe\
+\x74\x45\xbf\x37\x7d\x59\x25\xf1\x40\x7a\xfe\x08\x75\xee\x92\xb4\
+\xcf\xb9\xab\x5d\x2e\x16\xd6\xc9\x3b\xfc\x0f\xa9\x91\x5f\xc0\
+\x00\x00\x05\x64\
+\x00\
+\x00\x42\x3e\x78\x9c\xed\x9b\xdf\x4f\x93\x57\x18\xc7\x5f\x20\x8b\
+\x17\x4b\xa0\x8b\xc9\xa0\x45\xa0\x85\x82\xa5\xd0\xdf\xfc\x9c\x0b\
+\xb4\x6c\x33\x1a\xe9\xa0\x90\x21\x54\x44\x84\xc9\x2f\x71\x60\x54\
+\x10\x4a\xe9\xfb\xe2\xb2\xe9\xe6\x16\xcd\x16\x35\x2e\x8b\xba\xb9\
+\xb8\xa8\x9b\xdb\xdc\xcc\xa6\x9b\x22\x2d\x30\x77\xb1\x64\x57\x53\
+\xe4\x62\x7f\xc2\x2e\x96\xed\xf2\xd9\x73\xce\xdb\x8e\xae\x42\x2d\
+\x09\x6d\x8f\xe6\x3c\xe4\xcb\xd3\x9e\x9e\xb7\x3d\x9f\xf7\xf9\x71\
+\x4e\x48\x11\x84\x14\xfc\xb1\xdb\x05\xfc\xad\x16\x74\x75\x82\xf0\
+\xbc\x20\x08\x3a\x14\x0e\x09\xa2\x20\x8f\x53\xc3\x81\xf5\xcf\xca\
+\xe2\xc6\x8d\x1b\x37\x6e\xdc\x62\x35\xe9\x67\x93\x20\xfd\x62\x48\
+\x15\x03\xb6\x62\xd1\x6f\x6b\x43\xdf\xc5\x84\xfc\xd6\x36\x29\x60\
+\xd5\x89\xf7\x8c\xa9\xe2\xbc\x29\x3e\xec\x01\x2b\xaa\x0a\x65\x73\
+\xa1\xee\xa3\xfe\x42\xfd\xcd\x88\xc8\x5a\x7e\xc7\x98\x34\x8a\xbf\
+\x56\x09\xe2\x8c\x75\xcd\xf9\x8f\xcc\x55\x08\x53\xb3\xe5\xe9\x92\
+\xdf\x76\x07\x3f\x0b\x98\x14\xae\x4d\xf4\x5b\xd2\xc5\x80\x79\xcd\
+\xf9\x7d\x7e\x1b\x91\x26\x18\xfb\xe4\xb3\x2e\xaf\xfb\x98\x03\x1a\
+\x54\xbc\xf8\xb5\xf8\x19\x0f\x18\xe0\x5c\x49\x0f\xc8\x1a\x7d\x9c\
+\x9f\xf3\x73\x7e\xce\xcf\xf9\x39\x3f\xe7\xe7\xfc\x9c\x9f\xf3\x73\
+\x7e\xce\x9f\x00\xfe\xa9\x59\x59\xd2\xec\x0a\xe3\xa1\xb1\xd9\xa5\
+\xb1\x70\x49\x61\xd7\x7a\xa7\xad\x30\x89\x0a\x5d\x1f\xf9\x9e\x4c\
+\xf1\xe3\xda\xc6\x6f\x9a\xa1\xed\xb8\x16\x5c\x53\xf9\xf0\xfa\x47\
+\x3a\x10\x67\xe4\xb5\x13\x86\x8e\x0f\x8a\xc0\x25\xe5\x53\x3f\x71\
+\xdb\x02\xbb\x4f\x6f\xa4\xcf\xc3\xd5\xfc\x66\x01\x0c\x5d\x29\x85\
+\xde\x73\xc5\xe0\x12\xf3\x61\xdb\x58\x1e\xd4\xa3\x9a\xf0\xb5\x3d\
+\x1f\x17\x83\xf7\x8e\x85\x5d\x7e\x94\xef\xae\x15\xdc\xef\x15\x42\
+\xc5\x8e\x4c\xb0\xf7\x65\xc3\x81\xaf\x0c\x30\x35\x67\x83\xbd\x9f\
+\x95\xc0\x8b\xdd\x2a\xa8\xda\x99\x05\x5d\x67\x74\x30\x89\xf3\x5e\
+\x9d\x50\x43\x79\x5b\x26\x54\xb6\x67\x41\x55\x87\xac\x4d\xdd\x4a\
+\xca\xb9\x75\x24\x0f\xe7\x2a\xc1\xd1\xbf\x01\x6a\x7b\xb3\xe9\x9c\
+\x17\x3a\x95\xd0\x7e\xa2\x88\x7e\x06\xab\xfc\x24\x07\x0e\x7f\x6f\
+\x86\x2d\x87\xf2\xf0\x1e\x64\x41\xcb\xd1\x02\xf0\xdc\xb2\x40\x83\
+\x57\x43\x9f\x13\xe6\x89\x1f\x2d\x94\xa1\xc1\xab\xa6\x63\x0d\x3e\
+\x35\x0c\x5f\x2d\xa5\x71\x1f\xbe\x6a\xa0\xd7\xef\xc4\x1c\x19\xb8\
+\xa8\x87\x43\xd7\x4d\x70\xf0\x1b\x23\xbc\xf6\x56\x01\x54\xb8\xb3\
+\xe0\xe5\x7d\x39\x30\x7a\xc3\xfc\xff\x3a\x62\x89\x3f\x58\xa7\x03\
+\x9f\xea\x61\x53\x97\x92\xc6\xae\xed\x78\x21\x3e\x56\x41\x4d\x4f\
+\x36\xbc\x71\xb9\x94\xbe\xfe\x1f\x3f\x32\xb5\xbe\xa3\x85\x23\xf3\
+\x36\x9a\x27\x44\x34\x8f\xb0\x6e\xa6\xe6\xca\x70\xbc\x0c\x73\xde\
+\x0a\x2d\x6f\x6b\xe9\x5c\x7b\x7f\x36\x8c\x7c\x6b\x62\x9a\x3f\x54\
+\xef\x2d\x47\xb5\x34\xdf\xc9\x7d\xa8\xee\x50\x82\xfb\xfd\x42\xec\
+\x07\x4b\x75\x12\xe2\xdf\x7e\x4c\xbb\x2c\x8f\x07\xf3\xa4\xf7\xbc\
+\x1e\xeb\x5f\x4d\x73\x9f\xd4\x40\x33\xf6\x15\x2f\xf6\x8e\x28\x7d\
+\x90\x09\x7e\xc2\xd3\x4f\x72\x60\xb7\x92\xe6\x38\x89\x3f\x8d\xfd\
+\x5c\x0c\xfc\xf8\x78\xe4\x86\x09\x1a\x7d\x1a\xa8\xde\x85\xd7\xbb\
+\x33\xf1\x7d\x54\xd0\x84\xec\x23\xdf\x99\x1e\xb7\x07\x24\x9f\x1f\
+\xd7\x47\x72\x96\xac\x97\xc4\xac\x16\xf3\xbe\x0a\xe3\x4f\x6a\x38\
+\xd4\xbb\xa2\xf1\x8b\x7e\x1b\xad\x89\x8a\x60\xcf\x6b\x9c\xd4\xc0\
+\xe0\xa5\x12\xb9\xf7\xb3\xbc\xff\x85\xc5\xbe\xef\x82\x9e\xc6\xac\
+\x66\x8f\x0a\x3a\x4f\x6d\xa4\x7b\x01\xe9\xff\x03\xb8\x0f\x44\xd6\
+\x7f\x24\xbf\x0f\x6b\x67\xcb\xc1\x5c\x28\xc7\xb8\x93\x39\xa4\x96\
+\x48\x1f\x20\x73\x42\xf5\xc3\x32\xff\xf8\x0f\x66\xd8\x4a\xfa\x3f\
+\xb2\xb9\x24\x0d\xdd\xeb\x5b\xdf\xd5\xd2\x3a\xd8\x36\x9a\x87\x67\
+\x04\x4b\xf4\xf8\x63\xef\x73\x89\x1a\xba\x37\xbe\x32\x94\x03\x3d\
+\xe7\xf4\x34\xfe\xe4\xbc\xd0\x83\x7b\x23\xc9\x0f\x66\xf9\x71\x6d\
+\x24\xde\xa4\x6e\x49\xbc\x07\x2f\xc9\x35\x7f\xe0\x6b\x23\xd4\x0d\
+\x6e\xc0\x3e\x98\x45\x5f\x27\xfb\x7f\xc3\xa4\x1a\x2a\x77\xc8\xfd\
+\x3f\xb2\xff\x0d\x5d\x31\xc0\xe6\xfd\xb9\xb4\x6e\x48\x0f\xad\xee\
+\x94\xfb\x48\x0b\xde\x2b\x96\xf9\x49\xae\xf6\x7f\xa2\x87\x8e\x0f\
+\x8b\xe8\x39\x26\x74\x76\x25\x6b\x26\x67\x20\x72\xf6\xeb\x3b\x2f\
+\x8f\xef\xbd\x58\x02\xbb\x70\x1e\xe9\x8b\xcb\xd5\x35\xe9\x75\xdd\
+\x67\x75\xe0\xc6\xf3\xe4\xf6\x63\x05\xd0\x7e\xb2\x10\xf6\x7f\x69\
+\x60\x3e\xff\xe9\x39\x7e\xce\xf6\x48\x4c\x23\xc7\x57\x9a\x17\xde\
+\x47\xc3\xe7\x44\x9d\xcb\x10\x7f\x92\xc5\xf9\x39\x3f\xe7\xe7\xfc\
+\x4f\x3c\xff\x23\x7f\x2f\x8a\x4d\x0b\x4f\x0b\xbf\xe7\xb6\x19\x86\
+\xae\x15\xc3\xc0\xe5\xa2\x98\xb5\xef\x0b\x5d\x60\xf4\x96\x51\x35\
+\xf6\xd3\xda\x7f\x07\x28\x61\xfc\xe4\x6f\x28\x37\x8d\xd0\x7c\x52\
+\x05\x2f\x4d\x3e\x07\x75\xde\x98\xb5\xb8\x59\x5a\xef\xbc\x0e\x4e\
+\x61\xe0\x5a\xe1\x93\xcb\x8f\xea\xba\x90\x0f\x8e\x09\xc5\x6a\xb4\
+\x60\xf7\x28\xea\x6b\xc6\x14\x69\xb5\xe3\x8a\x35\x67\x4f\x24\xbf\
+\xe8\xb7\x42\xeb\xe9\x9c\xd5\xb0\x2f\xa2\x9c\xe5\xc3\x0a\x01\xef\
+\x41\x5c\xd8\x13\xce\x7f\x2a\x66\xfe\x87\x0e\x8f\xc2\xe9\x18\x57\
+\xa4\x3a\xe2\xc8\xce\x28\xff\x43\x12\x77\xc7\x61\x45\x4a\xbc\xd9\
+\x19\xe4\x5f\x44\xe6\x7a\xc7\x28\xb2\xc7\xa9\xde\x19\xe6\x5f\xa0\
+\x71\x4f\x40\xce\x33\xc8\xbf\x48\xeb\x7d\x18\xe3\x3e\x96\x38\x76\
+\x46\xf8\x17\x28\xbb\x47\x91\x96\xc8\xb8\x33\xc2\x4f\xf7\x38\xc7\
+\x59\x85\x90\x0c\xf6\x24\xf3\x2f\xd0\x5e\x97\xa4\xb8\x47\xf0\xc7\
+\xfd\xfb\xcf\x11\xfc\x72\xdc\x47\x13\xb3\xc7\x45\xe5\x9f\x2e\x13\
+\x7c\x77\xcb\xd2\x45\xbf\x6d\x3a\x21\xfc\x1e\x7a\xb6\xa9\xc7\xfd\
+\x3d\x35\x51\x7b\x5c\x34\x93\xfc\x16\x41\xba\x57\x29\x48\x01\x4b\
+\x93\x14\xc7\xff\x7f\xf0\xcd\x58\xff\x71\x9f\xc9\xfd\xcd\x3e\x9e\
+\xe1\xc4\x1e\x9f\xd0\x3d\xee\x71\x26\xcd\x1b\xf1\x1e\x94\xa6\x89\
+\x01\xab\x5e\x0c\xd8\xdc\xf1\xf8\x5f\x16\xe4\xef\xea\xfb\xbc\xa8\
+\xda\xd0\xfd\x0c\x13\x71\xe7\xc6\x8d\x1b\x37\x6e\x4f\xa7\xc1\x6a\
+\xed\x4f\x72\x55\xc6\x92\xff\x83\xf8\x75\xdc\x2f\xeb\x33\x22\x7c\
+\x6d\x84\xf7\x05\x3d\xc8\x3e\x25\xe8\xd3\x82\x7e\x5d\xd0\xe7\x45\
+\xf8\xda\xa0\xf7\x05\xe3\x11\x8c\x4b\xca\xaa\x83\x09\xf0\x2f\xab\
+\x2b\x39\x81\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00\x6f\xa6\x53\
+\x00\x69\
+\x00\x63\x00\x6f\x00\x6e\x00\x73\
+\x00\x08\
+\x06\x90\x42\x3f\
+\x00\x66\
+\x00\x6f\x00\x72\x00\x6d\x00\x2e\x00\x69\x00\x63\x00\x6f\
+\x00\x0c\
+\x08\x00\xc1\xdf\
+\x00\x74\
+\x00\x65\x00\x6d\x00\x70\x00\x6c\x00\x61\x00\x74\x00\x65\x00\x2e\x00\x69\x00\x63\x00\x6f\
+\x00\x14\
+\x08\x1d\x36\x5f\
+\x00\x66\
+\x00\x69\x00\x6e\x00\x64\x00\x2d\x00\x61\x00\x6e\x00\x64\x00\x2d\x00\x72\x00\x65\x00\x70\x00\x6c\x00\x61\x00\x63\x00\x65\x00\x2e\
+\x00\x69\x00\x63\x00\x6f\
+\x00\x07\
+\x0f\x36\x4f\x7f\
+\x00\x78\
+\x00\x6c\x00\x73\x00\x2e\x00\x69\x00\x63\x00\x6f\
+"
+
+qt_resource_struct_v1 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x04\x00\x00\x00\x02\
+\x00\x00\x00\x10\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00\x26\x00\x01\x00\x00\x00\x01\x00\x00\x0b\xca\
+\x00\x00\x00\x44\x00\x01\x00\x00\x00\x01\x00\x00\x0f\x9f\
+\x00\x00\x00\x72\x00\x01\x00\x00\x00\x01\x00\x00\x1c\xb3\
+"
+
+qt_resource_struct_v2 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x04\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x10\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x9e\x2d\x90\x67\xb8\
+\x00\x00\x00\x26\x00\x01\x00\x00\x00\x01\x00\x00\x0b\xca\
+\x00\x00\x01\x9e\x2d\x90\x67\xb8\
+\x00\x00\x00\x44\x00\x01\x00\x00\x00\x01\x00\x00\x0f\x9f\
+\x00\x00\x01\x9e\x2d\x90\x67\xb8\
+\x00\x00\x00\x72\x00\x01\x00\x00\x00\x01\x00\x00\x1c\xb3\
+\x00\x00\x01\x9e\x2d\x90\x67\xb8\
+"
+
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
@@ -2,129 +2,151 @@ import logging
 logger = logging.getLogger(__name__)
 
 import os
+import threading
 from datetime import datetime
+from functools import lru_cache
 from PyQt5 import QtWidgets, QtGui, QtCore
-from .workers import FillValuesWorker, BuildOutputWorker
-
-
-class Ui_Form:
+from .workers import FillValuesWorker, BuildOutputWorker, preload_netcore
+from . import resources_rc  # noqa: F401  (registers the ":/icons" resource prefix)
+
+_QSS = """
+QLabel[class="HeaderLabel"] {font-weight: 500; font-size: 14pt; border: none;}
+QPushButton[class="IconButton"] {background: transparent; border-radius: 15px;}
+QLabel[class="DescriptionText"] {border: none; background-color: transparent;}
+"""
+
+# (attribute prefix, header, icon, description) for each section, left to right
+_SECTIONS = (
+    ("template", "Template", "template",
+     'Select a configuration template with variables in "$VARIABLE$" format'),
+    ("form", "Form", "form",
+     "Open excel form and fill values against variables"),
+    ("replace", "Find & Replace", "find-and-replace",
+     "Find and replace variables with values submitted through the excel form"),
+    ("output", "Output", "xls",
+     "Open replaced output"),
+)
+
+_MODULE_DIR = os.path.dirname(__file__)
+_MODULE_NAME = os.path.basename(_MODULE_DIR)
+
+_PIXMAP_CACHE = {}
+
+
+def _load_pixmap(icon_path: str) -> QtGui.QPixmap:
     """
-    A PyQt5 UI form class for configuring and executing network diagnostics.
+    Load a pixmap, decoding each image only once per process.
 
-    """
+    Args:
+        icon_path (str): Qt resource path or filesystem path to the image.
 
-    def setup_ui(self, form):
-        """
-        Set up the layout and UI elements of the diagnostics form.
+    Returns:
+        QtGui.QPixmap: The cached QPixmap object.
+    """
+    pixmap = _PIXMAP_CACHE.get(icon_path)
+    if pixmap is None:
+        pixmap = _PIXMAP_CACHE[icon_path] = QtGui.QPixmap(icon_path)
+    return pixmap
 
-        Args:
-            form (QWidget): The parent widget to apply the layout and components to.
-        """
-        self.layout = QtWidgets.QHBoxLayout(form)
 
-        self._create_template_section(form)
-        self._create_form_section(form)
-        self._create_replace_section(form)
-        self._create_output_section(form)
+@lru_cache(maxsize=None)
+def _load_icon(filename: str) -> QtGui.QIcon:
+    """
+    Load an icon from the compiled Qt resources. Results are cached per filename.
 
-    def _create_template_section(self, parent):
-        """
-        Create the template selection UI section.
+    The icons are bundled from ``assets/resources.qrc``; regenerate the module with
+    ``pyrcc5 assets/resources.qrc -o resources_rc.py`` after changing any asset.
 
-        Args:
-            parent (QWidget): The parent widget.
-        """
-        self.template_widget = QtWidgets.QGroupBox(parent)
-        self.template_layout = self._create_section_layout(self.template_widget)
+    Args:
+        filename (str): Name of the icon file (without extension).
 
-        self.template_header_label = self._create_header_label("Template", self.template_widget)
-        self.template_layout.addWidget(self.template_header_label)
+    Returns:
+        QtGui.QIcon: The QIcon object.
+    """
+    icon_path = f":/icons/{filename}.ico"
+    icon = QtGui.QIcon()
+    icon.addPixmap(_load_pixmap(icon_path), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+    return icon
 
-        self.template_button = self._create_icon_button("template", self.template_widget)
-        self._add_button_to_layout(self.template_layout, self.template_button)
 
-        self.template_description = self._create_description_text(
-            'Select a configuration template with variables in "$VARIABLE$" format',
-            self.template_widget
-        )
-        self.template_layout.addWidget(self.template_description)
+class _DescriptionLabel(QtWidgets.QLabel):
+    """
+    Word-wrapped label that asks for the same height as the QTextEdit it replaced, so the
+    sections keep their original vertical proportions. The width is left to the Ignored
+    horizontal size policy.
+    """
 
-        self.layout.addWidget(self.template_widget)
+    def sizeHint(self):
+        """
+        Report the preferred size of the description.
 
-    def _create_form_section(self, parent):
+        Returns:
+            QtCore.QSize: The QTextEdit's default preferred height, with no preferred width.
         """
-        Create the form upload UI section.
+        return QtCore.QSize(0, 192)
 
-        Args:
-            parent (QWidget): The parent widget.
+    def minimumSizeHint(self):
         """
-        self.form_widget = QtWidgets.QGroupBox(parent)
-        self.form_widget.setStyleSheet('QFrame {border: 1px solid grey;}')
-        self.form_layout = self._create_section_layout(self.form_widget)
+        Report the smallest size the description can shrink to.
 
-        self.form_header_label = self._create_header_label("Form", self.form_widget)
-        self.form_layout.addWidget(self.form_header_label)
+        Returns:
+            QtCore.QSize: The QTextEdit's default minimum height, with no minimum width.
+        """
+        return QtCore.QSize(0, 71)
 
-        self.form_button = self._create_icon_button("form", self.form_widget)
-        self._add_button_to_layout(self.form_layout, self.form_button)
 
-        self.form_description = self._create_description_text(
-            "Open excel form and fill values against variables",
-            self.form_widget
-        )
-        self.form_layout.addWidget(self.form_description)
+class Ui_Form:
+    """
+    A PyQt5 UI form class for configuring and executing network diagnostics.
 
-        self.layout.addWidget(self.form_widget)
+    """
 
-    def _create_replace_section(self, parent):
+    def setup_ui(self, form):
         """
-        Create the variable replacement section.
+        Set up the layout and UI elements of the diagnostics form.
 
         Args:
-            parent (QWidget): The parent widget.
+            form (QWidget): The parent widget to apply the layout and components to.
         """
-        self.replace_widget = QtWidgets.QGroupBox(parent)
-        self.replace_widget.setStyleSheet('QFrame {border: 1px solid grey;}')
-        self.replace_layout = self._create_section_layout(self.replace_widget)
-
-        self.replace_header_label = self._create_header_label("Find & Replace", self.replace_widget)
-        self.replace_layout.addWidget(self.replace_header_label)
-
-        self.replace_button = self._create_icon_button("find-and-replace", self.replace_widget)
-        self._add_button_to_layout(self.replace_layout, self.replace_button)
-
-        self.replace_description = self._create_description_text(
-            "Find and replace variables with values submitted through the excel form",
-            self.replace_widget
-        )
-        self.replace_layout.addWidget(self.replace_description)
+        form.setStyleSheet(_QSS)
+        self.layout = QtWidgets.QHBoxLayout(form)
 
-        self.layout.addWidget(self.replace_widget)
+        for name, title, icon_name, description in _SECTIONS:
+            self._create_section(form, name, title, icon_name, description)
 
-    def _create_output_section(self, parent):
+    def _create_section(self, parent, name, title, icon_name, description):
         """
-        Create the output view section.
+        Create one section: a group box holding a header, an icon button and a description.
+
+        The widgets are stored as `<name>_widget`, `<name>_layout`, `<name>_header_label`,
+        `<name>_button` and `<name>_description`.
 
         Args:
             parent (QWidget): The parent widget.
+            name (str): Attribute prefix for the section's widgets.
+            title (str): Header text.
+            icon_name (str): Name of the icon file (without extension).
+            description (str): Description to display under the button.
         """
-        self.output_widget = QtWidgets.QGroupBox(parent)
-        self.output_widget.setStyleSheet('QFrame {border: 1px solid grey;}')
-        self.output_layout = self._create_section_layout(self.output_widget)
+        widget = QtWidgets.QGroupBox(parent)
+        layout = self._create_section_layout(widget)
 
-        self.output_header_label = self._create_header_label("Output", self.output_widget)
-        self.output_layout.addWidget(self.output_header_label)
+        header_label = self._create_header_label(title, widget)
+        layout.addWidget(header_label)
 
-        self.output_button = self._create_icon_button("xls", self.output_widget)
-        self._add_button_to_layout(self.output_layout, self.output_button)
+        button = self._create_icon_button(icon_name, widget)
+        self._add_button_to_layout(layout, button)
 
-        self.output_description = self._create_description_text(
-            "Open replaced output",
-            self.output_widget
-        )
-        self.output_layout.addWidget(self.output_description)
+        description_text = self._create_description_text(description, widget)
+        layout.addWidget(description_text)
+
+        self.layout.addWidget(widget)
 
-        self.layout.addWidget(self.output_widget)
+        setattr(self, f"{name}_widget", widget)
+        setattr(self, f"{name}_layout", layout)
+        setattr(self, f"{name}_header_label", header_label)
+        setattr(self, f"{name}_button", button)
+        setattr(self, f"{name}_description", description_text)
 
     def _create_section_layout(self, parent):
         """
@@ -155,7 +177,7 @@ class Ui_Form:
         """
         label = QtWidgets.QLabel(parent)
         label.setText(text)
-        label.setStyleSheet("font-weight: 500; font-size: 14pt; border:none;")
+        label.setProperty("class", "HeaderLabel")
         label.setAlignment(QtCore.Qt.AlignCenter)
         return label
 
@@ -171,29 +193,30 @@ class Ui_Form:
             QPushButton: Configured button widget.
         """
         button = QtWidgets.QPushButton(parent)
-        button.setStyleSheet("QPushButton {background: transparent; border-radius: 15px;}")
-        button.setIcon(self._get_icon(icon_name))
+        button.setProperty("class", "IconButton")
+        button.setIcon(_load_icon(icon_name))
         button.setMinimumSize(QtCore.QSize(100, 100))
         button.setIconSize(QtCore.QSize(64, 64))
         return button
 
     def _create_description_text(self, text, parent):
         """
-        Create a read-only description text area.
+        Create a word-wrapped description label.
 
         Args:
             text (str): Description to display.
             parent (QWidget): Parent widget.
 
         Returns:
-            QTextEdit: Configured text edit widget.
+            QLabel: Configured label widget.
         """
-        text_edit = QtWidgets.QTextEdit(parent)
-        text_edit.setStyleSheet("border:none; background-color: transparent;")
-        text_edit.setText(text)
-        text_edit.setAlignment(QtCore.Qt.AlignCenter)
-        text_edit.setReadOnly(True)
-        return text_edit
+        label = _DescriptionLabel(text, parent)
+        label.setProperty("class", "DescriptionText")
+        label.setWordWrap(True)
+        label.setAlignment(QtCore.Qt.AlignHCenter | QtCore.Qt.AlignTop)
+        # Take the remaining space like the QTextEdit did, so the sections stay equal width
+        label.setSizePolicy(QtWidgets.QSizePolicy.Ignored, QtWidgets.QSizePolicy.Expanding)
+        return label
 
     def _add_button_to_layout(self, layout, button):
         """
@@ -209,21 +232,6 @@ class Ui_Form:
         button_layout.addItem(QtWidgets.QSpacerItem(0, 0, QtWidgets.QSizePolicy.Expanding))
         layout.addLayout(button_layout)
 
-    def _get_icon(self, filename: str) -> QtGui.QIcon:
-        """
-        Load an icon from the assets directory.
-
-        Args:
-            filename (str): Name of the icon file (without extension).
-
-        Returns:
-            QtGui.QIcon: The QIcon object.
-        """
-        icon_path = os.path.join(os.path.dirname(__file__), "assets", f"{filename}.ico")
-        icon = QtGui.QIcon()
-        icon.addPixmap(QtGui.QPixmap(icon_path), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
-        return icon
-
 
 class Form(QtWidgets.QWidget, Ui_Form):
     """
@@ -242,8 +250,7 @@ class Form(QtWidgets.QWidget, Ui_Form):
         super().__init__(parent)
         self.kwargs = kwargs
         self.setup_ui(self)
-        self.output_dir = str(os.path.join(self.kwargs.get("output_dir"),
-                                           os.path.basename(os.path.dirname(__file__)).upper()))
+        self.output_dir = str(os.path.join(self.kwargs.get("output_dir"), _MODULE_NAME.upper()))
         self.output_report = ''
         self.data = {}
 
@@ -252,6 +259,9 @@ class Form(QtWidgets.QWidget, Ui_Form):
         self.replace_button.clicked.connect(self.build_output_event)
         self.output_button.clicked.connect(lambda: self.open_path(self.output_report))
 
+        # Warm up the Excel backend while the user is still picking a template
+        threading.Thread(target=preload_netcore, daemon=True).start()
+
         logger.debug("Form initialized with output_dir: %s", self.output_dir)
 
     def select_template_event(self):
@@ -266,15 +276,15 @@ class Form(QtWidgets.QWidget, Ui_Form):
 
     def fill_values_event(self):
         """
-        Start the worker thread to extract variables from the selected template.
+        Start the worker to extract variables from the selected template.
         """
         if 'template_file' not in self.data:
             logger.info('No template selected')
             return
 
-        self.fill_thread = FillValuesWorker(self.data['template_file'])
-        self.fill_thread.fill_complete.connect(self.fill_values_complete)
-        self.fill_thread.start()
+        self.fill_worker = FillValuesWorker(self.data['template_file'])
+        self.fill_worker.signals.fill_complete.connect(self.fill_values_complete)
+        QtCore.QThreadPool.globalInstance().start(self.fill_worker)
 
     def fill_values_complete(self, result):
         """
@@ -286,6 +296,8 @@ class Form(QtWidgets.QWidget, Ui_Form):
         self.data['config_template'] = result['config_template']
         self.data['var_list'] = result['var_list']
         self.data['variable_file_path'] = result['variable_file_path']
+        # The worker keeps its own reference to the template; drop it now that it is done
+        self.fill_worker = None
         self.open_path(self.data['variable_file_path'])
 
     def build_output_event(self):
@@ -299,21 +311,23 @@ class Form(QtWidgets.QWidget, Ui_Form):
         os.makedirs(self.output_dir, exist_ok=True)
 
         timestamp = datetime.now().strftime('%Y-%m-%d_%H.%M')
-        filename = f"{os.path.basename(os.path.dirname(__file__)).title()}_{timestamp}.xlsx"
+        filename = f"{_MODULE_NAME.title()}_{timestamp}.xlsx"
         self.output_report = os.path.join(self.output_dir, filename)
 
-        self.build_thread = BuildOutputWorker(
+        self.build_worker = BuildOutputWorker(
             self.data['config_template'],
             self.data['variable_file_path'],
             self.output_report
         )
-        self.build_thread.start()
-        self.build_thread.finished.connect(self.build_finished)
+        self.build_worker.signals.finished.connect(self.build_finished)
+        QtCore.QThreadPool.globalInstance().start(self.build_worker)
 
     def build_finished(self):
         """
-        Handle the build completion.
+        Handle the build completion and release the template.
         """
+        self.data.pop('config_template', None)
+        self.build_worker = None
         QtWidgets.QMessageBox.information(self, "Info", "Task completed!!")
 
     def open_path(self, path: str):
@@ -1,6 +1,7 @@
 import logging
 logger = logging.getLogger(__name__)
 
+import importlib
 import os
 import re
 import traceback
@@ -8,14 +9,40 @@ from tempfile import NamedTemporaryFile
 
 from PyQt5 import QtWidgets, QtCore
 
+_VAR_RE = re.compile(r'\$\w+\$')
+# The same pattern wrapped in a group, so split() keeps the variables between the text
+_SPLIT_RE = re.compile(f'({_VAR_RE.pattern})')
 
-class FillValuesWorker(QtCore.QThread):
+# Bits of a line's kind mask, recording which formats (text, highlight, error) the line contains
+_HAS_TEXT, _HAS_HIGHLIGHT, _HAS_ERROR = 1, 2, 4
+
+
+def preload_netcore():
+    """
+    Import `netcore` ahead of the first fill/build so its import cost is not paid on a click.
+
+    The import cannot live at module scope: `netcore` may only be reachable through the
+    `--lib` paths, which are added to `sys.path` after this module has been imported.
+    """
+    try:
+        importlib.import_module('netcore')
+    except ImportError:
+        logger.debug('netcore could not be preloaded', exc_info=True)
+
+
+class FillValuesWorker(QtCore.QRunnable):
     """
-    Worker thread to extract variables from a configuration template file and generate an Excel form.
+    Worker to extract variables from a configuration template file and generate an Excel form.
     The Excel form is pre-filled with variable names to allow the user to provide corresponding values.
+    Runs on the shared `QtCore.QThreadPool` so threads are reused across fill/build cycles.
     """
 
-    fill_complete = QtCore.pyqtSignal(dict)
+    class Signals(QtCore.QObject):
+        """
+        Signals emitted by the worker; QRunnable is not a QObject and cannot declare them itself.
+        """
+
+        fill_complete = QtCore.pyqtSignal(dict)
 
     def __init__(self, template_file):
         """
@@ -25,13 +52,14 @@ class FillValuesWorker(QtCore.QThread):
             template_file (str): Path to the configuration template file.
         """
         super().__init__()
+        self.signals = self.Signals()
         self.template_file = template_file
         self.config_template = ''
         self.var_list = []
 
     def run(self):
         """
-        Run the worker thread logic. Parses the template, extracts variables,
+        Run the worker logic. Parses the template, extracts variables,
         creates an Excel form, and emits a signal upon completion.
         """
         if not self.template_file:
@@ -47,28 +75,27 @@ class FillValuesWorker(QtCore.QThread):
         logger.info('Fill up the values against variables and save')
         logger.info('Once values are filled click "Replace"')
 
-        self.fill_complete.emit({
+        self.signals.fill_complete.emit({
             'config_template': self.config_template,
             'var_list': self.var_list,
             'variable_file_path': variable_file_path
         })
 
-    def get_template_vars(self, filepath, var_regex=r'\$\w+\$'):
+    def get_template_vars(self, filepath, var_regex=_VAR_RE):
         """
         Extract unique variable names from the configuration template.
 
         Args:
             filepath (str): Path to the template file.
-            var_regex (str): Regular expression pattern to match variable tokens.
+            var_regex (str or re.Pattern): Regular expression pattern to match variable tokens.
 
         Returns:
             tuple: The raw content of the file and a list of unique variables.
         """
-        content = open(filepath).read()
-        var_list = []
-        for var in re.findall(var_regex, content):
-            if var not in var_list:
-                var_list.append(var)
+        with open(filepath) as f:
+            content = f.read()
+        # finditer feeds the de-duplication lazily instead of materialising every occurrence
+        var_list = list(dict.fromkeys(match.group() for match in re.finditer(var_regex, content)))
         return content, var_list
 
     def create_excel_form(self, var_list):
@@ -88,9 +115,7 @@ class FillValuesWorker(QtCore.QThread):
         workbook = XLBW(filepath)
         worksheet = workbook.add_worksheet('Variables')
 
-        for row_idx in range(500):
-            for col_idx in range(50):
-                worksheet.write(row_idx, col_idx, '', workbook.ftbody)
+        worksheet.set_column(0, 49, None, workbook.ftbody)
 
         for idx, var in enumerate(var_list):
             worksheet.write(idx, 0, var, workbook.ftbody)
@@ -99,12 +124,20 @@ class FillValuesWorker(QtCore.QThread):
         return filepath
 
 
-class BuildOutputWorker(QtCore.QThread):
+class BuildOutputWorker(QtCore.QRunnable):
     """
-    Worker thread to read variable values from an Excel form, replace them in the template,
+    Worker to read variable values from an Excel form, replace them in the template,
     and write the result to an output Excel file.
+    Runs on the shared `QtCore.QThreadPool` so threads are reused across fill/build cycles.
     """
 
+    class Signals(QtCore.QObject):
+        """
+        Signals emitted by the worker; QRunnable is not a QObject and cannot declare them itself.
+        """
+
+        finished = QtCore.pyqtSignal()
+
     def __init__(self, template, variable_file_path, output_report):
         """
         Initialize the worker with the configuration template, variable form, and output path.
@@ -115,14 +148,24 @@ class BuildOutputWorker(QtCore.QThread):
             output_report (str): Path to save the output Excel file.
         """
         super().__init__()
+        self.signals = self.Signals()
         self.template = template
         self.variable_file_path = variable_file_path
         self.output_report = output_report
 
     def run(self):
         """
-        Run the worker thread logic. Replaces variables in the template using values from
-        the Excel form and writes the result to an output Excel file.
+        Run the worker logic and emit `finished` once done, whether or not output was built.
+        """
+        try:
+            self.build_output()
+        finally:
+            self.signals.finished.emit()
+
+    def build_output(self):
+        """
+        Replace variables in the template using values from the Excel form and write the
+        result to an output Excel file.
         """
         if not self.variable_file_path:
             logger.info('Variable form cannot be empty')
@@ -139,17 +182,13 @@ class BuildOutputWorker(QtCore.QThread):
         worksheet = workbook.add_worksheet('Output')
         ftb, fthl, fte = workbook.ftbody, workbook.fthighlight, workbook.fterror
 
-        for col_idx in range(1, worksheet_form.ncols):
-            cfg = []
-            repl_dict = {
-                worksheet_form.cell_value(row, 0): worksheet_form.cell_value(row, col_idx)
-                for row in range(worksheet_form.nrows)
-            }
-            cfg.extend(self.sub_get_string(self.template, repl_dict, ftb, fthl, fte))
-            self.write_rich_table(worksheet, cfg, ftb, fthl, fte, 0, col_idx - 1, 95)
-
-            if hasattr(logger, 'savings'):
-                logger.savings(10)
+        # Read the whole form once; row_values avoids per-cell dispatch in xlrd
+        rows = [worksheet_form.row_values(row) for row in range(worksheet_form.nrows)]
+        tokens = _tokenize_template(self.template, ftb)
+        # Generators keep only the current column's replacements and rendered lines alive
+        repl_dicts = ({row[0]: row[col_idx] for row in rows} for col_idx in range(1, worksheet_form.ncols))
+        rendered = (_format_config(tokens, repl_dict, fthl, fte) for repl_dict in repl_dicts)
+        self.write_columns(worksheet, rendered, ftb, fthl, fte)
 
         workbook.close()
 
@@ -161,57 +200,110 @@ class BuildOutputWorker(QtCore.QThread):
 
         logger.info('Variables Replaced!')
 
+    def write_columns(self, ws, rendered_columns, ftb, fthl, fte):
+        """
+        Write each rendered configuration into its own output column.
+
+        Args:
+            ws: The worksheet object.
+            rendered_columns (iterable): `_format_config` results, one per form column.
+            ftb, fthl, fte: Format styles for normal text, highlighted variables, and errors.
+        """
+        for col_idx, cfg in enumerate(rendered_columns):
+            self.write_rich_table(ws, cfg, ftb, fthl, fte, 0, col_idx, 95)
+
+            if hasattr(logger, 'savings'):
+                logger.savings(10)
+
     def write_rich_table(self, ws, cfg_lines, ftb, fthl, fte, row_index, col_index, col_width):
         """
         Write formatted configuration lines to an Excel worksheet.
 
         Args:
             ws: The worksheet object.
-            cfg_lines (list): List of rich text formatted lines.
+            cfg_lines (list): (kind_mask, rich text formatted line) tuples.
             ftb, fthl, fte: Format styles for normal text, highlighted variables, and errors.
             row_index (int): Starting row index.
             col_index (int): Column index to write into.
             col_width (int): Width of the output column.
         """
         ws.set_column(col_index, col_index, col_width)
-        for cfg_line in cfg_lines:
-            if ftb in cfg_line and (fthl in cfg_line or fte in cfg_line):
+        for kind_mask, cfg_line in cfg_lines:
+            if kind_mask & _HAS_TEXT and kind_mask & (_HAS_HIGHLIGHT | _HAS_ERROR):
                 ws.write_rich_string(row_index, col_index, *cfg_line)
-            elif fthl in cfg_line:
+            elif kind_mask & _HAS_HIGHLIGHT:
                 ws.write_string(row_index, col_index, cfg_line[-1].strip(), fthl)
-            elif fte in cfg_line:
+            elif kind_mask & _HAS_ERROR:
                 ws.write_string(row_index, col_index, cfg_line[-1].strip(), fte)
-            elif ftb in cfg_line:
+            elif kind_mask & _HAS_TEXT:
                 ws.write_string(row_index, col_index, cfg_line[-1], ftb)
             row_index += 1
 
-    def sub_get_string(self, cfg, repl, ftb, fthl, fte, var_regex=r'\$\w+\$'):
-        """
-        Replace variables in the configuration string using the replacement dictionary.
 
-        Args:
-            cfg (str): Configuration template string.
-            repl (dict): Dictionary of variable replacements.
-            ftb, fthl, fte: Format styles for text rendering.
-            var_regex (str): Regular expression pattern for variables.
+def _tokenize_template(cfg, ftb):
+    """
+    Parse the configuration template into per-line segments. The template is the same for every
+    form column, so this runs once per build and only the variable lookups repeat per column.
+
+    Args:
+        cfg (str): Configuration template string.
+        ftb: Format style for normal text.
+
+    Returns:
+        list: One (segments, var_slots, kind_mask) tuple per line. `segments` alternates format
+        and text as in `_format_config`'s output, with (None, variable) placeholders; `var_slots`
+        holds the index of each placeholder and `kind_mask` has `_HAS_TEXT` set if the line has
+        any text. Blank text is dropped.
+    """
+    tokens = []
+    # splitlines keeps the original line boundaries (\f, \v, \x85, \u2028, ...), not just '\n'
+    for line in cfg.splitlines():
+        # split yields alternating text and variables: even items are text, odd items variables
+        parts = _SPLIT_RE.split(line)
+        segments, var_slots, kind_mask = [], [], 0
+        for idx in range(0, len(parts), 2):
+            text = parts[idx]
+            if text.strip():
+                segments += (ftb, text)
+                kind_mask |= _HAS_TEXT
+            if idx + 1 < len(parts):
+                var_slots.append(len(segments))
+                segments += (None, parts[idx + 1])
+        tokens.append((segments, var_slots, kind_mask))
+    return tokens
+
+
+def _format_config(tokens, repl, fthl, fte):
+    """
+    Replace variables in the tokenized template, producing rich text formatted lines.
 
-        Returns:
-            list: List of rich text formatted configuration lines.
-        """
-        cfg_format = []
-        for line in cfg.splitlines():
-            non_reg = re.split(var_regex, line)
-            reg = re.findall(var_regex, line)
-            format_line = []
-            for i in range(len(reg)):
-                if not re.search(r'^\s*$', non_reg[i]):
-                    format_line.extend([ftb, non_reg[i]])
-                value = repl.get(reg[i], '')
-                if not re.search(r'^\s*$', value):
-                    format_line.extend([fthl, value])
-                else:
-                    format_line.extend([fte, reg[i]])
-            if not re.search(r'^\s*$', non_reg[-1]):
-                format_line.extend([ftb, non_reg[-1]])
-            cfg_format.append(format_line)
-        return cfg_format
+    Only the variable slots are filled per call; lines without variables are returned as the
+    template's own segment lists, shared between calls, so callers must not modify them.
+
+    Args:
+        tokens (list): Template tokens produced by `_tokenize_template`.
+        repl (dict): Dictionary of variable replacements.
+        fthl, fte: Format styles for highlighted variables and errors.
+
+    Returns:
+        list: One (kind_mask, segments) tuple per line, where `segments` alternates format and
+        text and `kind_mask` has a `_HAS_*` bit set for each format present, so writers can
+        dispatch without scanning the segments.
+    """
+    cfg_format = []
+    for segments, var_slots, kind_mask in tokens:
+        if not var_slots:
+            cfg_format.append((kind_mask, segments))
+            continue
+        format_line = segments[:]
+        for slot in var_slots:
+            value = repl.get(format_line[slot + 1], '')
+            if value.strip():
+                format_line[slot] = fthl
+                format_line[slot + 1] = value
+                kind_mask |= _HAS_HIGHLIGHT
+            else:
+                format_line[slot] = fte
+                kind_mask |= _HAS_ERROR
+        cfg_format.append((kind_mask, format_line))
+    return cfg_format